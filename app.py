@@ -10,10 +10,12 @@ from llama_index.llms.llama_cpp import LlamaCPP
 
 from config.settings import *
 from core.index_manager import IndexManager
+import utils
+from utils.chat_history import ChatHistory
 from utils.performance_monitor import performance_monitor
 
-# 로깅 설정
-logging.basicConfig(level=getattr(logging, LOG_LEVEL), format=LOG_FORMAT)
+# 로깅 설정 (Streamlit 재실행 시에는 재적용되지 않음)
+utils.init(LOG_LEVEL, LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
 # Streamlit 페이지 설정
@@ -64,17 +66,24 @@ def load_index_manager():
     """인덱스 매니저 로드"""
     return IndexManager()
 
+# 쿼리 엔진 생성 (캐시됨, 인덱스 객체가 바뀌면 index_key로 다시 생성)
+# 최신 엔진 하나만 유지해 이전 인덱스(faiss, docstore)가 메모리에 남지 않도록 함
+@st.cache_resource(max_entries=1, show_spinner=False)
+def build_query_engine(_index_manager, _llm, top_k, index_key):
+    """쿼리 엔진 생성"""
+    return _index_manager.get_query_engine(_llm, similarity_top_k=top_k)
+
 # 세션 상태 초기화
-if "messages" not in st.session_state:
-    st.session_state.messages = []
+if "chat_history" not in st.session_state:
+    st.session_state.chat_history = ChatHistory()
 
 # 강제 작업 처리
 if st.session_state.get("clear_cache", False):
     with st.spinner("캐시 초기화 중..."):
         index_manager = load_index_manager()
-        index_manager.clear_cache()
+        index_manager.clear_index()
         st.cache_resource.clear()
-        st.session_state.messages = []
+        st.session_state.chat_history = ChatHistory()
         st.session_state.clear_cache = False
     st.success("캐시가 초기화되었습니다.")
     st.rerun()
@@ -87,6 +96,7 @@ index_manager = load_index_manager()
 force_rebuild = st.session_state.get("force_index_rebuild", False)
 if force_rebuild:
     st.session_state.force_index_rebuild = False
+    build_query_engine.clear()
 
 with performance_monitor.measure_time("인덱스 생성/업데이트"):
     try:
@@ -95,7 +105,8 @@ with performance_monitor.measure_time("인덱스 생성/업데이트"):
             st.error("⚠️ 인덱싱할 문서가 없습니다. `docs/` 폴더에 지원되는 파일을 추가해주세요.")
             st.stop()
         
-        query_engine = index_manager.get_query_engine(llm)
+        # 캐시된 엔진이 인덱스를 참조하므로 id(index)는 재사용되지 않음
+        query_engine = build_query_engine(index_manager, llm, SIMILARITY_TOP_K, id(index))
         
     except Exception as e:
         st.error(f"❌ 인덱스 초기화 실패: {e}")
@@ -124,58 +135,57 @@ with st.sidebar:
 st.header("💬 채팅")
 
 # 채팅 기록 표시
-for message in st.session_state.messages:
-    with st.chat_message(message["role"]):
-        st.write(message["content"])
-        if message["role"] == "assistant" and "sources" in message:
+chat_history = st.session_state.chat_history
+for role, content, sources in chat_history:
+    with st.chat_message(role):
+        st.write(content)
+        if role == "assistant" and sources:
             with st.expander("📄 출처 문서"):
-                st.write(", ".join(message["sources"]))
+                st.write(", ".join(sources))
 
 # 새 메시지 입력
 if prompt := st.chat_input("질문을 입력해주세요..."):
     # 사용자 메시지 표시
     with st.chat_message("user"):
         st.write(prompt)
-    st.session_state.messages.append({"role": "user", "content": prompt})
+    chat_history.append("user", prompt)
     
     # 챗봇 응답 생성
     with st.chat_message("assistant"):
-        with st.spinner("답변 생성 중..."):
-            try:
-                # 성능 모니터링과 함께 쿼리 실행
-                with performance_monitor.measure_time("질의 응답"):
+        try:
+            # 성능 모니터링과 함께 쿼리 실행 (토큰이 생성되는 대로 표시)
+            with performance_monitor.measure_time("질의 응답"):
+                with st.spinner("관련 문서 검색 중..."):
                     response = query_engine.query(prompt)
                 
-                # 답변 표시
-                st.write(response.response)
-                
-                # 출처 정보 추출
-                sources = []
-                if hasattr(response, 'source_nodes'):
-                    sources = [node.node.metadata.get("source", "Unknown") for node in response.source_nodes]
-                
-                # 출처 표시
-                if sources:
-                    with st.expander("📄 출처 문서"):
-                        st.write(", ".join(set(sources)))  # 중복 제거
-                
-                # 세션에 저장
-                st.session_state.messages.append({
-                    "role": "assistant", 
-                    "content": response.response,
-                    "sources": sources
-                })
-                
-            except Exception as e:
-                error_message = f"죄송합니다. 답변 생성 중 오류가 발생했습니다: {str(e)}"
-                st.error(error_message)
-                logger.error(f"쿼리 처리 오류: {e}")
-                
-                st.session_state.messages.append({
-                    "role": "assistant", 
-                    "content": error_message,
-                    "sources": []
-                })
+                placeholder = st.empty()
+                answer = ""
+                for token in response.response_gen:
+                    answer += token
+                    placeholder.markdown(answer + "▌")
+                placeholder.markdown(answer)
+            
+            # 출처 정보 추출 (순서를 유지하며 중복 제거, 추가 시 한 번만 수행)
+            sources = []
+            if hasattr(response, 'source_nodes'):
+                sources = list(dict.fromkeys(
+                    node.node.metadata.get("source", "Unknown") for node in response.source_nodes
+                ))
+            
+            # 출처 표시
+            if sources:
+                with st.expander("📄 출처 문서"):
+                    st.write(", ".join(sources))
+            
+            # 세션에 저장
+            chat_history.append("assistant", answer, sources)
+            
+        except Exception as e:
+            error_message = f"죄송합니다. 답변 생성 중 오류가 발생했습니다: {str(e)}"
+            st.error(error_message)
+            logger.error(f"쿼리 처리 오류: {e}")
+            
+            chat_history.append("assistant", error_message)
 
 # 하단 정보
 st.markdown("---")
@@ -191,7 +201,7 @@ with st.expander("ℹ️ 사용법 및 정보"):
     ### 🚀 최적화 기능
     - 증분 인덱싱: 새로운/수정된 파일만 처리
     - 임베딩 캐시: 중복 계산 방지
-    - FAISS IVF: 빠른 유사도 검색
+    - FAISS Flat/HNSW: 코퍼스 크기에 맞춘 유사도 검색
     - 성능 모니터링: 실시간 시스템 상태 추적
     
     ### 💡 사용 팁
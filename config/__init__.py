@@ -25,10 +25,21 @@ from .settings import (
     CHUNK_OVERLAP,
     SIMILARITY_TOP_K,
     
+    # 임베딩 설정
+    EMBEDDING_MODEL_NAME,
+    EMBED_BATCH_SIZE,
+    GPU_EMBED_BATCH_SIZE,
+    EMBEDDING_DEVICE,
+    EMBEDDING_BACKEND,
+    ONNX_MODEL_DIR,
+    
     # 벡터 저장소 설정
     EMBEDDING_DIM,
-    FAISS_NLIST,
-    FAISS_NPROBE,
+    FAISS_FLAT_MAX_VECTORS,
+    FAISS_HNSW_M,
+    FAISS_HNSW_EF_CONSTRUCTION,
+    FAISS_HNSW_EF_SEARCH,
+    FAISS_IVFPQ_MIN_VECTORS,
     
     # LLM 설정
     LLM_MODEL_PATH,
@@ -55,9 +66,18 @@ __all__ = [
     "CHUNK_SIZE",
     "CHUNK_OVERLAP",
     "SIMILARITY_TOP_K",
+    "EMBEDDING_MODEL_NAME",
+    "EMBED_BATCH_SIZE",
+    "GPU_EMBED_BATCH_SIZE",
+    "EMBEDDING_DEVICE",
+    "EMBEDDING_BACKEND",
+    "ONNX_MODEL_DIR",
     "EMBEDDING_DIM",
-    "FAISS_NLIST",
-    "FAISS_NPROBE",
+    "FAISS_FLAT_MAX_VECTORS",
+    "FAISS_HNSW_M",
+    "FAISS_HNSW_EF_CONSTRUCTION",
+    "FAISS_HNSW_EF_SEARCH",
+    "FAISS_IVFPQ_MIN_VECTORS",
     "LLM_MODEL_PATH",
     "LLM_TEMPERATURE",
     "LLM_MAX_NEW_TOKENS",
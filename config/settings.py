@@ -17,10 +17,28 @@ CHUNK_SIZE = 256
 CHUNK_OVERLAP = 50
 SIMILARITY_TOP_K = 2
 
+# 문서 로드 설정
+LOAD_PROCESS_MIN_BYTES = 1 << 20  # 총 크기가 이보다 작으면 프로세스 대신 스레드 풀 사용
+LOAD_WORKERS = int(os.getenv("RAG_LOAD_WORKERS", "0")) or max(1, (os.cpu_count() or 2) - 1)
+
+# 임베딩 설정
+EMBEDDING_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+EMBED_BATCH_SIZE = 64
+GPU_EMBED_BATCH_SIZE = 128
+EMBEDDING_DEVICE = os.getenv("RAG_EMBED_DEVICE", "auto")  # auto | cpu | cuda
+EMBEDDING_BACKEND = os.getenv("RAG_EMBED_BACKEND", "auto")  # auto | onnx | hf
+ONNX_MODEL_DIR = MODELS_DIR / "minilm-int8"
+
 # 벡터 저장소 설정
 EMBEDDING_DIM = 384  # all-MiniLM-L6-v2 차원
-FAISS_NLIST = 100
-FAISS_NPROBE = 10
+FAISS_FLAT_MAX_VECTORS = 50_000  # 이하에서는 정확 검색(IndexFlatIP)
+FAISS_HNSW_M = 32
+FAISS_HNSW_EF_CONSTRUCTION = 200
+FAISS_HNSW_EF_SEARCH = 64
+FAISS_IVFPQ_MIN_VECTORS = 500_000  # 이상에서는 IVF-PQ(FastScan)로 메모리/지연 절감
+FAISS_IVFPQ_SPEC = "PQ32x4fs"  # 4비트 PQ FastScan
+FAISS_IVF_TRAIN_PER_LIST = 64  # 클러스터당 학습 샘플 수
+FAISS_MAX_DELETED_RATIO = 0.2  # 삭제 표시(HNSW) 벡터가 이 비율을 넘으면 재빌드로 정리
 
 # LLM 설정
 LLM_MODEL_PATH = MODELS_DIR / "llama-2-7b-chat.Q4_K_M.gguf"
@@ -31,6 +49,8 @@ LLM_CONTEXT_WINDOW = 2048
 # 캐시 설정
 DOCUMENT_CACHE_TTL = 3600  # 1시간
 EMBEDDING_CACHE_SIZE = 1000
+MARKDOWN_CACHE_DIR = CACHE_DIR / "markdown_html"  # Markdown -> HTML 변환 결과 캐시
+MARKDOWN_CACHE_MAX_AGE_DAYS = 30  # 이 기간 동안 사용되지 않은 변환 결과는 정리
 
 # 로깅 설정
 LOG_LEVEL = "INFO"
@@ -21,7 +21,9 @@ Example:
 # 핵심 클래스들을 패키지 레벨로 import
 from .document_manager import DocumentManager
 from .index_manager import IndexManager
-from .embedding_cache import EmbeddingCache
+from .embedding_cache import EmbeddingCache, QueryEmbeddingCache
+from .embedding_models import CachedHFEmbedding, CachedOnnxEmbedding
+from .vector_store import BatchFaissVectorStore
 
 # 패키지 초기화 시 로깅 설정
 import logging
@@ -40,6 +42,10 @@ __all__ = [
     "DocumentManager",
     "IndexManager", 
     "EmbeddingCache",
+    "QueryEmbeddingCache",
+    "CachedHFEmbedding",
+    "CachedOnnxEmbedding",
+    "BatchFaissVectorStore",
 ]
 
 # 패키지 레벨 상수
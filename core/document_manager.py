@@ -5,15 +5,23 @@
 import hashlib
 import json
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterator, List, Set, Tuple
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
-from config.settings import DOCS_DIR, CACHE_DIR
+from config.settings import DOCS_DIR, CACHE_DIR, SUPPORTED_EXTENSIONS
 
 logger = logging.getLogger(__name__)
 
+# 해시 계산 시 한 번에 읽을 크기 (1 MiB)
+HASH_CHUNK_SIZE = 1 << 20
+
+# 해시 계산 스레드 수 (I/O 바운드, hashlib은 GIL을 해제함)
+HASH_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 class DocumentManager:
     """문서 변경 감지 및 메타데이터 관리"""
     
@@ -40,17 +48,36 @@ class DocumentManager:
             json.dump(self.metadata, f, ensure_ascii=False, indent=2)
     
     def _get_file_hash(self, filepath: Path) -> str:
-        """파일 해시값 계산 (MD5)"""
-        hash_md5 = hashlib.md5()
+        """파일 해시값 계산 (BLAKE2b)"""
         try:
             with open(filepath, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+                # Python 3.11+: 읽기 루프를 C 구현에 위임
+                if sys.version_info >= (3, 11):
+                    return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+                
+                file_hash = hashlib.blake2b(digest_size=16)
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                    file_hash.update(chunk)
+                return file_hash.hexdigest()
         except Exception as e:
             logger.error(f"파일 해시 계산 실패 {filepath}: {e}")
             return ""
     
+    def _iter_document_files(self) -> Iterator[os.DirEntry]:
+        """지원 형식의 문서 파일을 재귀적으로 순회 (os.scandir 기반)"""
+        stack = [str(self.docs_dir)]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS and entry.is_file():
+                            yield entry
+            except OSError as e:
+                logger.warning(f"디렉토리 스캔 실패 {directory}: {e}")
+    
     def scan_documents(self) -> Tuple[List[Path], List[Path], List[Path]]:
         """
         문서 스캔 및 변경사항 감지
@@ -60,32 +87,56 @@ class DocumentManager:
         current_files = set()
         new_files = []
         modified_files = []
+        to_rehash = []
         
-        # 현재 디렉토리의 모든 지원 파일 스캔
-        for file_path in self.docs_dir.rglob("*"):
-            if file_path.is_file() and file_path.suffix in {'.pdf', '.csv', '.md', '.docx', '.json'}:
-                current_files.add(str(file_path))
-                
-                # 파일 해시 확인
-                current_hash = self._get_file_hash(file_path)
-                file_key = str(file_path)
-                
-                if file_key not in self.metadata:
-                    # 새 파일
-                    new_files.append(file_path)
-                    self.metadata[file_key] = {
-                        'hash': current_hash,
-                        'last_modified': datetime.now().isoformat(),
-                        'size': file_path.stat().st_size
-                    }
-                elif self.metadata[file_key]['hash'] != current_hash:
-                    # 수정된 파일
-                    modified_files.append(file_path)
-                    self.metadata[file_key].update({
-                        'hash': current_hash,
-                        'last_modified': datetime.now().isoformat(),
-                        'size': file_path.stat().st_size
-                    })
+        # 1단계: 지원 파일 수집 후 mtime/크기가 바뀐 파일만 재해시 대상으로 분류
+        for entry in self._iter_document_files():
+            file_key = entry.path
+            current_files.add(file_key)
+            
+            stat = entry.stat()
+            stored = self.metadata.get(file_key)
+            if (stored is not None
+                    and stored.get('mtime_ns') == stat.st_mtime_ns
+                    and stored.get('size') == stat.st_size):
+                continue
+            to_rehash.append((Path(file_key), stat))
+        
+        # 2단계: 재해시 대상 병렬 해시 계산
+        file_paths = [file_path for file_path, _ in to_rehash]
+        if len(file_paths) > 1:
+            with ThreadPoolExecutor(max_workers=HASH_MAX_WORKERS) as executor:
+                hashes = list(executor.map(self._get_file_hash, file_paths))
+        else:
+            hashes = [self._get_file_hash(file_path) for file_path in file_paths]
+        
+        # 3단계: 메인 스레드에서 메타데이터 갱신
+        for (file_path, stat), current_hash in zip(to_rehash, hashes):
+            file_key = str(file_path)
+            stored = self.metadata.get(file_key)
+            file_info = {
+                'hash': current_hash,
+                'last_modified': datetime.now().isoformat(),
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns
+            }
+            if not current_hash:
+                # 해시 실패 (권한, 잠금 등): stat 정보를 남기지 않아 다음 스캔에서 다시 해시
+                del file_info['mtime_ns']
+                if stored is not None:
+                    stored.pop('mtime_ns', None)
+            
+            if stored is None:
+                # 새 파일
+                new_files.append(file_path)
+                self.metadata[file_key] = file_info
+            elif stored['hash'] != current_hash:
+                # 수정된 파일
+                modified_files.append(file_path)
+                stored.update(file_info)
+            elif current_hash:
+                # 내용은 동일 (touch 등) - stat 정보만 갱신
+                stored.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
         
         # 삭제된 파일 확인
         stored_files = set(self.metadata.keys())
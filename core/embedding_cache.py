@@ -2,84 +2,185 @@
 임베딩 결과 캐시 관리
 중복 임베딩 계산 방지로 성능 최적화
 """
-import pickle
 import hashlib
+import re
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 import logging
 
-from config.settings import CACHE_DIR, EMBEDDING_CACHE_SIZE
+import numpy as np
+
+from config.settings import CACHE_DIR, EMBEDDING_CACHE_SIZE, EMBEDDING_DIM
 
 logger = logging.getLogger(__name__)
 
+# 캐시 키 정규화용 공백 패턴
+_WS_RE = re.compile(r'\s+')
+
+# 캐시 적중 시각(last_used)을 모아 두었다가 한 번에 기록할 항목 수
+LAST_USED_FLUSH_SIZE = 1024
+
+def _flush_last_used(conn: sqlite3.Connection, lock: threading.Lock, pending: Dict[bytes, int]):
+    """보류 중인 last_used 갱신을 한 트랜잭션으로 기록 (락은 호출자가 잡지 않은 상태여야 함)"""
+    with lock:
+        _write_last_used(conn, pending)
+
+def _write_last_used(conn: sqlite3.Connection, pending: Dict[bytes, int]):
+    """보류 중인 last_used 갱신 기록 (락을 잡은 상태에서 호출)"""
+    if not pending:
+        return
+    conn.execute("BEGIN")
+    conn.executemany(
+        "UPDATE embeddings SET last_used = ? WHERE hash = ?",
+        [(used, text_hash) for text_hash, used in pending.items()]
+    )
+    conn.execute("COMMIT")
+    pending.clear()
+
 class EmbeddingCache:
-    """임베딩 결과 캐시 관리 클래스"""
+    """임베딩 결과 캐시 관리 클래스
+    
+    벡터는 (max_size, EMBEDDING_DIM) float16 메모리 맵 파일의 슬롯에 저장하고,
+    SQLite에는 해시 -> 슬롯 매핑과 마지막 사용 시각만 저장합니다.
+    LRU 순서는 메모리의 OrderedDict로 관리하고, 캐시 적중 시각은 모아 두었다가
+    LAST_USED_FLUSH_SIZE개마다, flush() 호출 시, 또는 인스턴스 정리/종료 시 일괄 기록합니다.
     
-    def __init__(self, cache_dir: Path = CACHE_DIR, max_size: int = EMBEDDING_CACHE_SIZE):
+    namespace(예: 임베딩 백엔드와 정밀도)를 지정하면 별도 파일에 저장해
+    서로 다른 모델의 벡터가 섞이지 않도록 합니다.
+    """
+    
+    cache_filename = "embeddings.db"
+    
+    def __init__(self, cache_dir: Path = CACHE_DIR, max_size: int = EMBEDDING_CACHE_SIZE, namespace: str = ""):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
-        self.cache_file = self.cache_dir / "embedding_cache.pkl"
+        cache_filename = Path(self.cache_filename)
+        if namespace:
+            cache_filename = cache_filename.with_name(f"{cache_filename.stem}-{namespace}{cache_filename.suffix}")
+        self.cache_file = self.cache_dir / cache_filename
+        self.vectors_file = self.cache_file.with_suffix(".f16")
         self.max_size = max_size
-        self.cache: Dict[str, Any] = self._load_cache()
-    
-    def _load_cache(self) -> Dict[str, Any]:
-        """캐시 파일 로드"""
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, 'rb') as f:
-                    cache = pickle.load(f)
-                    logger.info(f"임베딩 캐시 로드 완료: {len(cache)}개 항목")
-                    return cache
-            except Exception as e:
-                logger.error(f"캐시 로드 실패: {e}")
-        return {}
-    
-    def _save_cache(self):
-        """캐시 파일 저장"""
-        try:
-            with open(self.cache_file, 'wb') as f:
-                pickle.dump(self.cache, f)
-            logger.debug(f"캐시 저장 완료: {len(self.cache)}개 항목")
-        except Exception as e:
-            logger.error(f"캐시 저장 실패: {e}")
+        
+        # Streamlit은 재실행마다 다른 스레드를 사용하므로 연결을 공유하고 락으로 보호
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.cache_file, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        
+        # 벡터 BLOB을 저장하던 이전 스키마이거나, 벡터 파일이 없거나 크기가 맞지 않으면 캐시 초기화
+        # (벡터 파일 없이 매핑만 남으면 0 벡터가 캐시 적중으로 반환됨)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(embeddings)")}
+        shape = (max_size, EMBEDDING_DIM)
+        expected_bytes = max_size * EMBEDDING_DIM * np.dtype(np.float16).itemsize
+        if "vec" in columns or not self.vectors_file.exists() or self.vectors_file.stat().st_size != expected_bytes:
+            self.conn.execute("DROP TABLE IF EXISTS embeddings")
+            self.vectors_file.unlink(missing_ok=True)
+        
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "hash BLOB PRIMARY KEY, slot INTEGER NOT NULL, last_used INTEGER NOT NULL)"
+        )
+        mode = "r+" if self.vectors_file.exists() else "w+"
+        self.vecs = np.memmap(self.vectors_file, mode=mode, dtype=np.float16, shape=shape)
+        
+        # 해시 -> 슬롯 매핑 (오래 사용되지 않은 순서, LRU)
+        self.idx: "OrderedDict[bytes, int]" = OrderedDict(
+            self.conn.execute("SELECT hash, slot FROM embeddings ORDER BY last_used")
+        )
+        used = set(self.idx.values())
+        self._free_slots = [slot for slot in range(max_size - 1, -1, -1) if slot not in used]
+        
+        # 기록 대기 중인 캐시 적중 시각 (해시 -> last_used), GC 또는 인터프리터 종료 시에도 기록
+        self._pending_last_used: Dict[bytes, int] = {}
+        weakref.finalize(self, _flush_last_used, self.conn, self._lock, self._pending_last_used)
+        logger.info(f"임베딩 캐시 로드 완료: {len(self.idx)}개 항목")
     
-    def _get_text_hash(self, text: str) -> str:
-        """텍스트 해시값 생성"""
-        return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+    def _get_text_hash(self, text: str) -> bytes:
+        """정규화된 텍스트 해시값 생성 (BLAKE2b 64비트, raw bytes)
+        
+        연속 공백과 대소문자 차이는 무시합니다. all-MiniLM-L6-v2는 uncased 모델이라
+        임베딩 결과가 같으며, 원문은 docstore에 그대로 저장되고 캐시 키만 정규화됩니다.
+        """
+        norm = _WS_RE.sub(' ', text).strip().lower()
+        return hashlib.blake2b(norm.encode('utf-8'), digest_size=8).digest()
     
     def get_embedding(self, text: str) -> Optional[List[float]]:
-        """캐시에서 임베딩 조회"""
+        """캐시에서 임베딩 조회 (float32로 변환해 반환)"""
         text_hash = self._get_text_hash(text)
-        return self.cache.get(text_hash)
+        with self._lock:
+            slot = self.idx.get(text_hash)
+            if slot is None:
+                return None
+            
+            # 조회된 항목을 최근 사용으로 갱신 (LRU, SQLite 기록은 일괄 처리)
+            self._touch(text_hash, time.time_ns())
+            vec = self.vecs[slot].astype(np.float32)
+        return vec.tolist()
+    
+    def _touch(self, text_hash: bytes, now: int):
+        """항목을 최근 사용으로 표시 (락을 잡은 상태에서 호출)"""
+        self.idx.move_to_end(text_hash)
+        self._pending_last_used[text_hash] = now
+        if len(self._pending_last_used) >= LAST_USED_FLUSH_SIZE:
+            _write_last_used(self.conn, self._pending_last_used)
+    
+    def flush(self):
+        """보류 중인 last_used 갱신을 SQLite에 기록"""
+        _flush_last_used(self.conn, self._lock, self._pending_last_used)
     
     def store_embedding(self, text: str, embedding: List[float]):
         """임베딩을 캐시에 저장"""
         text_hash = self._get_text_hash(text)
+        now = time.time_ns()
         
-        # 캐시 크기 관리 (LRU 방식)
-        if len(self.cache) >= self.max_size:
-            # 가장 오래된 항목 제거
-            oldest_key = next(iter(self.cache))
-            del self.cache[oldest_key]
-            logger.debug("캐시 크기 초과, 오래된 항목 제거")
-        
-        self.cache[text_hash] = embedding
-        
-        # 주기적으로 캐시 저장 (10개마다)
-        if len(self.cache) % 10 == 0:
-            self._save_cache()
+        with self._lock:
+            slot = self.idx.get(text_hash)
+            if slot is not None:
+                self.vecs[slot] = np.asarray(embedding, dtype=np.float16)
+                self._touch(text_hash, now)
+                return
+            
+            if self._free_slots:
+                slot = self._free_slots.pop()
+            else:
+                # 캐시 크기 관리 (LRU: 가장 오래 사용되지 않은 항목의 슬롯 재사용)
+                evicted_hash, slot = self.idx.popitem(last=False)
+                self._pending_last_used.pop(evicted_hash, None)
+                self.conn.execute("DELETE FROM embeddings WHERE hash = ?", (evicted_hash,))
+                logger.debug("캐시 크기 초과, 오래된 항목 제거")
+            
+            # 벡터를 먼저 기록한 뒤 매핑 저장
+            self.vecs[slot] = np.asarray(embedding, dtype=np.float16)
+            self.conn.execute(
+                "INSERT INTO embeddings (hash, slot, last_used) VALUES (?, ?, ?)",
+                (text_hash, slot, now)
+            )
+            self.idx[text_hash] = slot
     
     def clear_cache(self):
         """캐시 초기화"""
-        self.cache.clear()
-        if self.cache_file.exists():
-            self.cache_file.unlink()
+        with self._lock:
+            self.conn.execute("DELETE FROM embeddings")
+            self.conn.execute("VACUUM")
+            self.idx.clear()
+            self._pending_last_used.clear()
+            self._free_slots = list(range(self.max_size - 1, -1, -1))
         logger.info("임베딩 캐시 초기화 완료")
     
-    def get_cache_stats(self) -> Dict[str, int]:
+    def get_cache_stats(self) -> Dict[str, Any]:
         """캐시 통계 정보"""
         return {
-            'total_entries': len(self.cache),
+            'total_entries': len(self.idx),
             'max_size': self.max_size,
             'cache_file_exists': self.cache_file.exists()
-        }
\ No newline at end of file
+        }
+
+class QueryEmbeddingCache(EmbeddingCache):
+    """사용자 질의 임베딩 캐시 (반복/유사 질문 시 임베딩 모델 호출 생략)"""
+    
+    cache_filename = "query_embeddings.db"
@@ -0,0 +1,192 @@
+"""
+임베딩 모델 래퍼
+EmbeddingCache를 먼저 조회해 중복 추론을 생략하는 임베딩 모델
+"""
+import importlib.util
+import os
+import platform
+from pathlib import Path
+from typing import Any, List, Optional
+import logging
+
+import numpy as np
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from llama_index.core.bridge.pydantic import PrivateAttr
+from llama_index.embeddings.huggingface import HuggingFaceEmbedding
+
+from config.settings import EMBEDDING_MODEL_NAME, ONNX_MODEL_DIR
+from core.embedding_cache import EmbeddingCache
+
+logger = logging.getLogger(__name__)
+
+class CachedEmbeddingMixin:
+    """임베딩 캐시 조회 믹스인 (캐시 적중 시 모델 추론 생략)
+    
+    BaseEmbedding 하위 클래스 앞에 섞어 사용하며, 하위 클래스는
+    `_embedding_cache`, `_query_cache` private attribute를 선언해야 합니다.
+    """
+    
+    def _get_query_embedding(self, query: str) -> List[float]:
+        """질의 임베딩 (질의 캐시 우선 조회)"""
+        cache = self._query_cache
+        embedding = cache.get_embedding(query) if cache is not None else None
+        if embedding is None:
+            embedding = super()._get_query_embedding(query)
+            if cache is not None:
+                cache.store_embedding(query, embedding)
+        return embedding
+    
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """텍스트 배치 임베딩 (캐시 미스만 모델에 전달)"""
+        cache = self._embedding_cache
+        if cache is None:
+            return super()._get_text_embeddings(texts)
+        
+        embeddings = [cache.get_embedding(text) for text in texts]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        
+        if missing:
+            computed = super()._get_text_embeddings([texts[i] for i in missing])
+            for i, embedding in zip(missing, computed):
+                cache.store_embedding(texts[i], embedding)
+                embeddings[i] = embedding
+        
+        logger.debug(f"임베딩 캐시 적중: {len(texts) - len(missing)}/{len(texts)}")
+        return embeddings
+    
+    def _get_text_embedding(self, text: str) -> List[float]:
+        """단일 텍스트 임베딩"""
+        cache = self._embedding_cache
+        embedding = cache.get_embedding(text) if cache is not None else None
+        if embedding is None:
+            embedding = super()._get_text_embedding(text)
+            if cache is not None:
+                cache.store_embedding(text, embedding)
+        return embedding
+
+class CachedHFEmbedding(CachedEmbeddingMixin, HuggingFaceEmbedding):
+    """EmbeddingCache를 사용하는 HuggingFace 임베딩 모델"""
+    
+    _embedding_cache: Optional[EmbeddingCache] = PrivateAttr(default=None)
+    _query_cache: Optional[EmbeddingCache] = PrivateAttr(default=None)
+    
+    def __init__(
+        self,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        query_cache: Optional[EmbeddingCache] = None,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self._embedding_cache = embedding_cache
+        self._query_cache = query_cache
+
+# optimum이 저장하는 int8 양자화 모델 파일명
+ONNX_QUANTIZED_FILENAME = "model_quantized.onnx"
+
+def is_onnx_available(model_dir: Path = ONNX_MODEL_DIR) -> bool:
+    """ONNX 임베딩 사용 가능 여부 (내보내기가 필요하면 optimum도 필요)"""
+    if importlib.util.find_spec("onnxruntime") is None:
+        return False
+    if (Path(model_dir) / ONNX_QUANTIZED_FILENAME).exists():
+        return True
+    return importlib.util.find_spec("optimum") is not None
+
+def export_quantized_onnx(model_name: str, output_dir: Path) -> Path:
+    """HuggingFace 모델을 ONNX로 내보내고 int8 동적 양자화 (최초 1회)"""
+    from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    from transformers import AutoTokenizer
+    
+    logger.info(f"ONNX int8 모델 내보내기 중: {model_name} -> {output_dir}")
+    output_dir = Path(output_dir)
+    model = ORTModelForFeatureExtraction.from_pretrained(model_name, export=True)
+    
+    # ARM(Apple Silicon 등)은 arm64, x86은 VNNI 설정 사용
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        qconfig = AutoQuantizationConfig.arm64(is_static=False, per_channel=False)
+    else:
+        qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+    
+    ORTQuantizer.from_pretrained(model).quantize(save_dir=output_dir, quantization_config=qconfig)
+    AutoTokenizer.from_pretrained(model_name).save_pretrained(output_dir)
+    return output_dir / ONNX_QUANTIZED_FILENAME
+
+class OnnxEmbedding(BaseEmbedding):
+    """ONNX Runtime int8 양자화 모델 기반 문장 임베딩 (CPU, mean pooling + L2 정규화)"""
+    
+    _session: Any = PrivateAttr()
+    _tokenizer: Any = PrivateAttr()
+    _input_names: set = PrivateAttr()
+    _max_length: int = PrivateAttr()
+    
+    def __init__(
+        self,
+        model_name: str = EMBEDDING_MODEL_NAME,
+        model_dir: Path = ONNX_MODEL_DIR,
+        max_length: int = 256,
+        **kwargs
+    ):
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+        
+        model_dir = Path(model_dir)
+        model_path = model_dir / ONNX_QUANTIZED_FILENAME
+        if not model_path.exists():
+            model_path = export_quantized_onnx(model_name, model_dir)
+        
+        super().__init__(model_name=model_name, **kwargs)
+        
+        sess_options = ort.SessionOptions()
+        sess_options.intra_op_num_threads = os.cpu_count() or 1
+        self._session = ort.InferenceSession(
+            str(model_path), sess_options=sess_options, providers=["CPUExecutionProvider"]
+        )
+        self._tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self._input_names = {node.name for node in self._session.get_inputs()}
+        self._max_length = max_length
+    
+    @classmethod
+    def class_name(cls) -> str:
+        return "OnnxEmbedding"
+    
+    def _embed(self, texts: List[str]) -> List[List[float]]:
+        """배치 임베딩 (배치 내 최장 길이에 맞춰 동적 패딩)"""
+        encoded = self._tokenizer(
+            texts, padding=True, truncation=True, max_length=self._max_length, return_tensors="np"
+        )
+        feed = {name: encoded[name].astype(np.int64) for name in self._input_names if name in encoded}
+        token_embeddings = self._session.run(None, feed)[0]
+        
+        # attention mask 기반 mean pooling 후 L2 정규화
+        mask = encoded["attention_mask"][..., None].astype(np.float32)
+        pooled = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+        return pooled.tolist()
+    
+    def _get_query_embedding(self, query: str) -> List[float]:
+        return self._embed([query])[0]
+    
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return self._get_query_embedding(query)
+    
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return self._embed([text])[0]
+    
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return self._embed(texts)
+
+class CachedOnnxEmbedding(CachedEmbeddingMixin, OnnxEmbedding):
+    """EmbeddingCache를 사용하는 ONNX int8 임베딩 모델"""
+    
+    _embedding_cache: Optional[EmbeddingCache] = PrivateAttr(default=None)
+    _query_cache: Optional[EmbeddingCache] = PrivateAttr(default=None)
+    
+    def __init__(
+        self,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        query_cache: Optional[EmbeddingCache] = None,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self._embedding_cache = embedding_cache
+        self._query_cache = query_cache
@@ -2,27 +2,39 @@
 인덱스 생성, 로드, 증분 업데이트 관리
 최적화된 인덱싱 전략으로 성능 향상
 """
-import os
+import math
 import time
 from pathlib import Path
 from typing import List, Optional
 import logging
 
 import faiss
+import numpy as np
 from llama_index.core import VectorStoreIndex, Document, Settings, StorageContext, load_index_from_storage
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from llama_index.core.schema import MetadataMode
 from llama_index.vector_stores.faiss import FaissVectorStore
-from llama_index.embeddings.huggingface import HuggingFaceEmbedding
 
 from config.settings import (
-    STORAGE_DIR, CHUNK_SIZE, CHUNK_OVERLAP, EMBEDDING_DIM, 
-    FAISS_NLIST, FAISS_NPROBE, SIMILARITY_TOP_K
+    STORAGE_DIR, CHUNK_SIZE, CHUNK_OVERLAP, EMBEDDING_DIM, SIMILARITY_TOP_K,
+    FAISS_FLAT_MAX_VECTORS, FAISS_HNSW_M, FAISS_HNSW_EF_CONSTRUCTION, FAISS_HNSW_EF_SEARCH,
+    FAISS_IVFPQ_MIN_VECTORS, FAISS_IVFPQ_SPEC, FAISS_IVF_TRAIN_PER_LIST, FAISS_MAX_DELETED_RATIO,
+    EMBEDDING_MODEL_NAME, EMBED_BATCH_SIZE, GPU_EMBED_BATCH_SIZE, EMBEDDING_DEVICE, EMBEDDING_BACKEND
 )
 from core.document_manager import DocumentManager
-from core.embedding_cache import EmbeddingCache
-from loaders.custom_loaders import CustomDocumentLoader
+from core.embedding_cache import EmbeddingCache, QueryEmbeddingCache
+from core.embedding_models import CachedHFEmbedding, CachedOnnxEmbedding, is_onnx_available
+from core.vector_store import BatchFaissVectorStore
+from loaders.custom_loaders import CustomDocumentLoader, prune_markdown_cache
 
 logger = logging.getLogger(__name__)
 
+# 학습 완료된 빈 IVF-PQ 인덱스 파일명 (동일 조건 재빌드 시 학습 생략)
+IVF_TRAINED_FILENAME = "ivf_trained.faiss"
+
+# 인덱스를 빌드한 임베딩 백엔드 기록 파일명 (백엔드가 바뀌면 재빌드)
+EMBED_BACKEND_FILENAME = "embed_backend.txt"
+
 class IndexManager:
     """인덱스 생성 및 관리 클래스"""
     
@@ -30,9 +42,11 @@ class IndexManager:
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(exist_ok=True)
         
-        # 컴포넌트 초기화
+        # 컴포넌트 초기화 (임베딩 캐시는 백엔드별로 분리)
+        self.embed_backend = self._resolve_embed_backend()
         self.doc_manager = DocumentManager()
-        self.embedding_cache = EmbeddingCache()
+        self.embedding_cache = EmbeddingCache(namespace=self.embed_backend)
+        self.query_cache = QueryEmbeddingCache(namespace=self.embed_backend)
         self.loader = CustomDocumentLoader()
         
         # 설정 적용
@@ -41,30 +55,152 @@ class IndexManager:
         
         # 인덱스 상태
         self._index: Optional[VectorStoreIndex] = None
-        self._embed_model: Optional[HuggingFaceEmbedding] = None
+        self._embed_model: Optional[BaseEmbedding] = None
+    
+    @staticmethod
+    def _resolve_embed_device() -> str:
+        """임베딩 추론 장치 결정 (RAG_EMBED_DEVICE로 CPU 강제 가능)"""
+        if EMBEDDING_DEVICE == "cpu":
+            return "cpu"
+        try:
+            import torch
+            if torch.cuda.is_available():
+                return "cuda"
+        except ImportError:
+            pass
+        if EMBEDDING_DEVICE == "cuda":
+            logger.warning("CUDA를 사용할 수 없어 CPU로 임베딩합니다")
+        return "cpu"
     
-    def _get_embed_model(self) -> HuggingFaceEmbedding:
-        """임베딩 모델 로드 (lazy loading)"""
+    def _resolve_embed_backend(self) -> str:
+        """임베딩 백엔드와 정밀도 결정 (hf-fp16 | onnx-int8 | hf-fp32)
+        
+        CUDA를 사용할 수 있으면 GPU에서 FP16으로 추론합니다. CPU에서는 ONNX Runtime을
+        사용할 수 있으면 int8 양자화 모델을, 아니면 HuggingFace(PyTorch) 모델을 사용합니다.
+        """
+        if self._resolve_embed_device() == "cuda":
+            return "hf-fp16"
+        if EMBEDDING_BACKEND == "onnx" or (EMBEDDING_BACKEND == "auto" and is_onnx_available()):
+            return "onnx-int8"
+        return "hf-fp32"
+    
+    def _get_embed_model(self) -> BaseEmbedding:
+        """임베딩 모델 로드 (lazy loading, 임베딩 캐시 연동)
+        
+        백엔드는 초기화 시 _resolve_embed_backend()로 결정됩니다.
+        RAG_EMBED_DEVICE, RAG_EMBED_BACKEND로 강제 지정 가능.
+        """
         if self._embed_model is None:
             logger.info("임베딩 모델 로드 중...")
             start_time = time.time()
-            self._embed_model = HuggingFaceEmbedding(
-                model_name="sentence-transformers/all-MiniLM-L6-v2"
+            
+            device = "cuda" if self.embed_backend == "hf-fp16" else "cpu"
+            batch_size = EMBED_BATCH_SIZE
+            if self.embed_backend == "hf-fp16":
+                import torch
+                model_cls = CachedHFEmbedding
+                batch_size = GPU_EMBED_BATCH_SIZE
+                # 출력은 리스트로 변환되고 faiss 삽입 시 float32로 변환됨
+                model_kwargs = {"normalize": True, "device": device, "model_kwargs": {"torch_dtype": torch.float16}}
+            elif self.embed_backend == "onnx-int8":
+                model_cls = CachedOnnxEmbedding
+                model_kwargs = {}
+            else:
+                model_cls = CachedHFEmbedding
+                model_kwargs = {"normalize": True, "device": device}  # L2 정규화 -> 내적(IP)이 코사인 유사도와 동일
+            
+            self._embed_model = model_cls(
+                model_name=EMBEDDING_MODEL_NAME,
+                embed_batch_size=batch_size,
+                embedding_cache=self.embedding_cache,
+                query_cache=self.query_cache,
+                **model_kwargs
             )
-            logger.info(f"임베딩 모델 로드 완료: {time.time() - start_time:.2f}초")
+            logger.info(f"임베딩 모델 로드 완료 ({model_cls.__name__}, {device}): {time.time() - start_time:.2f}초")
         return self._embed_model
     
-    def _create_vector_store(self) -> FaissVectorStore:
-        """FAISS 벡터 저장소 생성"""
-        # IVF (Inverted File) 인덱스 생성으로 빠른 검색
-        quantizer = faiss.IndexFlatL2(EMBEDDING_DIM)
-        faiss_index = faiss.IndexIVFFlat(quantizer, EMBEDDING_DIM, FAISS_NLIST)
-        faiss_index.nprobe = FAISS_NPROBE
+    def _create_vector_store(self, n_hint: int, train_vectors: Optional[np.ndarray] = None) -> FaissVectorStore:
+        """FAISS 벡터 저장소 생성 (예상 벡터 수에 따라 인덱스 선택)
+        
+        Args:
+            n_hint: 인덱싱할 벡터(청크) 수 추정치
+            train_vectors: IVF 학습용 임베딩 행렬 (대규모 코퍼스에서 필요)
+        """
+        if n_hint < FAISS_FLAT_MAX_VECTORS:
+            # 소규모 코퍼스: 학습 불필요한 정확 검색이 가장 빠름
+            faiss_index = faiss.IndexFlatIP(EMBEDDING_DIM)
+        elif n_hint < FAISS_IVFPQ_MIN_VECTORS:
+            # 대규모 코퍼스: HNSW 그래프 기반 근사 검색 (벡터 제거 미지원 -> 삭제 표시 후 검색 시 제외)
+            faiss_index = faiss.IndexHNSWFlat(EMBEDDING_DIM, FAISS_HNSW_M, faiss.METRIC_INNER_PRODUCT)
+            faiss_index.hnsw.efConstruction = FAISS_HNSW_EF_CONSTRUCTION
+            faiss_index.hnsw.efSearch = FAISS_HNSW_EF_SEARCH
+        else:
+            # 초대규모 코퍼스: IVF-PQ FastScan (nlist ≈ sqrt(N), nprobe ≈ sqrt(nlist))
+            # nlist는 2의 거듭제곱으로 맞춰 코퍼스가 조금 바뀌어도 저장된 학습 결과를 재사용
+            nlist = 1 << max(0, round(math.log2(math.sqrt(n_hint))))
+            faiss_index = faiss.index_factory(
+                EMBEDDING_DIM, f"IVF{nlist},{FAISS_IVFPQ_SPEC}", faiss.METRIC_INNER_PRODUCT
+            )
+            trained_index = self._load_trained_ivf(faiss_index)
+            if trained_index is not None:
+                faiss_index = trained_index
+            else:
+                if train_vectors is None:
+                    raise ValueError("IVF-PQ 인덱스 생성에는 학습용 임베딩이 필요합니다.")
+                self._train_ivf_index(faiss_index, train_vectors, nlist)
+                faiss.write_index(faiss_index, str(self.storage_dir / IVF_TRAINED_FILENAME))
+            faiss.extract_index_ivf(faiss_index).nprobe = max(1, int(math.sqrt(nlist)))
+        
+        logger.info(f"FAISS 인덱스 선택: {type(faiss_index).__name__} (벡터 {n_hint}개)")
+        
+        # 파일 단위 선택 삭제를 위해 ID 매핑 인덱스로 래핑
+        return BatchFaissVectorStore(faiss_index=faiss.IndexIDMap2(faiss_index))
+    
+    def _train_ivf_index(self, faiss_index, vectors: np.ndarray, nlist: int):
+        """IVF 인덱스 학습 (전체 대신 무작위 샘플 사용)"""
+        sample_size = min(len(vectors), nlist * FAISS_IVF_TRAIN_PER_LIST)
+        if sample_size < len(vectors):
+            rng = np.random.default_rng(0)
+            vectors = vectors[rng.choice(len(vectors), sample_size, replace=False)]
+        
+        logger.info(f"IVF 인덱스 학습 중... (nlist={nlist}, 샘플 {sample_size}개)")
+        start_time = time.time()
+        faiss_index.train(vectors)
+        logger.info(f"IVF 인덱스 학습 완료: {time.time() - start_time:.2f}초")
+    
+    def _load_trained_ivf(self, template) -> Optional[faiss.Index]:
+        """저장된 학습 완료 IVF 인덱스 로드 (구성이 template과 같을 때만 재사용)
+        
+        Returns:
+            학습된 빈 인덱스, 없거나 구성이 다르면 None
+        """
+        path = self.storage_dir / IVF_TRAINED_FILENAME
+        if not path.exists():
+            return None
+        
+        try:
+            faiss_index = faiss.read_index(str(path))
+            ivf, expected = faiss.extract_index_ivf(faiss_index), faiss.extract_index_ivf(template)
+        except RuntimeError as e:
+            logger.warning(f"저장된 IVF 학습 결과 로드 실패: {e}")
+            return None
+        
+        if not (
+            faiss_index.is_trained and faiss_index.ntotal == 0
+            and faiss_index.d == template.d and faiss_index.metric_type == template.metric_type
+            and type(ivf) is type(expected) and ivf.nlist == expected.nlist and ivf.code_size == expected.code_size
+        ):
+            return None
         
-        return FaissVectorStore(faiss_index=faiss_index)
+        logger.info(f"저장된 IVF 학습 결과 재사용 (nlist={ivf.nlist}, 학습 생략)")
+        return faiss_index
     
-    def _load_existing_index(self) -> Optional[VectorStoreIndex]:
-        """기존 인덱스 로드"""
+    def _load_existing_index(self, read_only: bool = False) -> Optional[VectorStoreIndex]:
+        """기존 인덱스 로드
+        
+        Args:
+            read_only: True면 FAISS 인덱스를 메모리 맵으로 로드 (업데이트 불가)
+        """
         try:
             if not (self.storage_dir / "docstore.json").exists():
                 return None
@@ -72,7 +208,15 @@ class IndexManager:
             logger.info("기존 인덱스 로드 중...")
             start_time = time.time()
             
-            storage_context = StorageContext.from_defaults(persist_dir=str(self.storage_dir))
+            vector_store = BatchFaissVectorStore.from_persist_dir(str(self.storage_dir), mmap=read_only)
+            if not isinstance(vector_store.client, faiss.IndexIDMap2):
+                logger.warning("이전 형식의 FAISS 인덱스입니다. 인덱스를 재빌드합니다.")
+                return None
+            
+            storage_context = StorageContext.from_defaults(
+                vector_store=vector_store,
+                persist_dir=str(self.storage_dir)
+            )
             index = load_index_from_storage(
                 storage_context, 
                 embed_model=self._get_embed_model()
@@ -90,19 +234,35 @@ class IndexManager:
         logger.info(f"새 인덱스 생성 중... ({len(documents)}개 문서)")
         start_time = time.time()
         
-        vector_store = self._create_vector_store()
+        # 청크 분할을 먼저 수행해 임베딩 배치를 직접 제어
+        nodes = Settings.node_parser.get_nodes_from_documents(documents)
         embed_model = self._get_embed_model()
         
-        # 임베딩 캐시 활용한 인덱스 생성
-        index = VectorStoreIndex.from_documents(
-            documents,
-            vector_store=vector_store,
+        # 청크 임베딩을 큰 배치로 선계산 (캐시 적중 청크는 추론 생략)
+        texts = [node.get_content(metadata_mode=MetadataMode.EMBED) for node in nodes]
+        embeddings = embed_model.get_text_embedding_batch(texts, show_progress=True)
+        for node, embedding in zip(nodes, embeddings):
+            node.embedding = embedding
+        
+        vector_store = self._create_vector_store(
+            n_hint=len(nodes),
+            train_vectors=np.asarray(embeddings, dtype=np.float32)
+        )
+        storage_context = StorageContext.from_defaults(vector_store=vector_store)
+        
+        # 임베딩이 채워진 노드는 llama-index가 다시 임베딩하지 않음
+        # insert_batch_size를 노드 수로 맞춰 벡터 저장소 add()를 한 번만 호출
+        index = VectorStoreIndex(
+            nodes,
+            storage_context=storage_context,
             embed_model=embed_model,
+            insert_batch_size=max(len(nodes), 1),
             show_progress=True
         )
         
-        # 인덱스 저장
+        # 인덱스 저장 (빌드에 사용한 임베딩 백엔드도 기록)
         index.storage_context.persist(persist_dir=str(self.storage_dir))
+        (self.storage_dir / EMBED_BACKEND_FILENAME).write_text(self.embed_backend, encoding='utf-8')
         
         logger.info(f"인덱스 생성 완료: {time.time() - start_time:.2f}초")
         return index
@@ -115,16 +275,57 @@ class IndexManager:
         logger.info(f"증분 인덱스 업데이트 중... ({len(new_documents)}개 문서)")
         start_time = time.time()
         
-        # 새 문서를 기존 인덱스에 추가
-        for doc in new_documents:
-            index.insert(doc)
+        # 새 문서를 한 번에 청크 분할 후 일괄 삽입 (임베딩 배치 처리)
+        nodes = Settings.node_parser.get_nodes_from_documents(new_documents)
+        index.insert_nodes(nodes)
         
-        # 업데이트된 인덱스 저장
+        # 업데이트된 인덱스 저장 (삽입 완료 후 한 번만)
         index.storage_context.persist(persist_dir=str(self.storage_dir))
         
         logger.info(f"증분 업데이트 완료: {time.time() - start_time:.2f}초")
         return index
     
+    def _remove_files_from_index(self, index: VectorStoreIndex, file_paths: List[Path]) -> bool:
+        """파일에 속한 벡터와 노드를 인덱스에서 선택적으로 제거
+        
+        HNSW 인덱스는 벡터를 삭제 표시만 하므로, 삭제 표시 비율이
+        FAISS_MAX_DELETED_RATIO를 넘으면 재빌드해 정리합니다.
+        
+        Returns:
+            bool: 제거 성공 여부 (False면 전체 재빌드 필요)
+        """
+        vector_store = index.vector_store
+        if not isinstance(vector_store, BatchFaissVectorStore):
+            return False
+        
+        for file_path in file_paths:
+            for vec_id in vector_store.delete_file(str(file_path)):
+                node_id = index.index_struct.nodes_dict.pop(str(vec_id), None)
+                if node_id is not None:
+                    index.docstore.delete_document(node_id, raise_error=False)
+        
+        if vector_store.num_deleted > FAISS_MAX_DELETED_RATIO * vector_store.client.ntotal:
+            logger.info(f"삭제 표시된 벡터가 많아 인덱스를 재빌드합니다 ({vector_store.num_deleted}/{vector_store.client.ntotal})")
+            return False
+        
+        index.storage_context.index_store.add_index_struct(index.index_struct)
+        logger.info(f"인덱스에서 {len(file_paths)}개 파일의 벡터 제거 완료")
+        return True
+    
+    def _embed_backend_changed(self) -> bool:
+        """저장된 인덱스가 현재와 다른 임베딩 백엔드로 빌드되었는지 확인 (기록이 없으면 변경으로 간주)"""
+        if not (self.storage_dir / "docstore.json").exists():
+            return False
+        try:
+            stored = (self.storage_dir / EMBED_BACKEND_FILENAME).read_text(encoding='utf-8').strip()
+        except FileNotFoundError:
+            stored = None
+        if stored == self.embed_backend:
+            return False
+        
+        logger.warning(f"임베딩 백엔드 변경 ({stored} -> {self.embed_backend}), 인덱스를 재빌드합니다.")
+        return True
+    
     def create_or_update_index(self, force_rebuild: bool = False) -> VectorStoreIndex:
         """
         인덱스 생성 또는 업데이트
@@ -138,22 +339,41 @@ class IndexManager:
         # 문서 변경사항 스캔
         new_files, modified_files, deleted_files = self.doc_manager.scan_documents()
         
-        # 기존 인덱스 로드 시도
-        existing_index = None if force_rebuild else self._load_existing_index()
+        # 다른 백엔드로 만든 벡터와 섞이지 않도록 재빌드 (IVF 학습 결과도 폐기)
+        if self._index is None and self._embed_backend_changed():
+            force_rebuild = True
+            (self.storage_dir / IVF_TRAINED_FILENAME).unlink(missing_ok=True)
+        
+        # 변경사항이 없고 이미 로드된 인덱스가 있으면 그대로 사용 (재로드 생략)
+        has_changes = bool(new_files or modified_files or deleted_files)
+        if not force_rebuild and not has_changes and self._index is not None:
+            return self._index
+        
+        # 기존 인덱스 로드 시도 (변경사항이 없으면 읽기 전용 메모리 맵으로 빠르게 로드)
+        existing_index = None if force_rebuild else self._load_existing_index(read_only=not has_changes)
+        
+        # 삭제/수정된 파일의 기존 벡터는 선택적으로 제거 (불가능하면 전체 재빌드)
+        stale_files = deleted_files + modified_files
+        if existing_index is not None and stale_files:
+            if not self._remove_files_from_index(existing_index, stale_files):
+                existing_index = None
         
         # 인덱스 생성/업데이트 전략 결정
-        if existing_index is None or deleted_files:
-            # 새 인덱스 생성 (삭제된 파일이 있거나 기존 인덱스 없음)
+        if existing_index is None:
+            # 새 인덱스 생성 (기존 인덱스 없음 또는 선택 삭제 불가)
             all_files = self.doc_manager.get_all_indexed_files()
             if all_files:
                 documents = self.loader.load_documents(all_files)
                 self._index = self._create_new_index(documents)
+                
+                # 전체 로드 후 오래 사용되지 않은 Markdown 변환 캐시 정리
+                prune_markdown_cache()
             else:
                 logger.warning("인덱싱할 문서가 없습니다.")
                 return None
         
         elif new_files or modified_files:
-            # 증분 업데이트
+            # 증분 업데이트 (수정된 파일은 기존 벡터 제거 후 재삽입)
             files_to_update = new_files + modified_files
             new_documents = self.loader.load_documents(files_to_update)
             self._index = self._update_index_incremental(existing_index, new_documents)
@@ -162,6 +382,11 @@ class IndexManager:
             for file_path in files_to_update:
                 self.doc_manager.mark_as_indexed(file_path)
         
+        elif deleted_files:
+            # 삭제만 발생: 제거 결과만 저장
+            existing_index.storage_context.persist(persist_dir=str(self.storage_dir))
+            self._index = existing_index
+        
         else:
             # 변경사항 없음
             logger.info("문서 변경사항이 없어 기존 인덱스를 사용합니다.")
@@ -169,14 +394,15 @@ class IndexManager:
         
         return self._index
     
-    def get_query_engine(self, llm, similarity_top_k: int = SIMILARITY_TOP_K):
-        """쿼리 엔진 생성"""
+    def get_query_engine(self, llm, similarity_top_k: int = SIMILARITY_TOP_K, streaming: bool = True):
+        """쿼리 엔진 생성 (streaming=True면 응답 토큰을 response_gen으로 순차 반환)"""
         if self._index is None:
             raise ValueError("인덱스가 생성되지 않았습니다. create_or_update_index()를 먼저 호출하세요.")
         
         return self._index.as_query_engine(
             llm=llm,
-            similarity_top_k=similarity_top_k
+            similarity_top_k=similarity_top_k,
+            streaming=streaming
         )
     
     def get_index_stats(self) -> dict:
@@ -189,7 +415,7 @@ class IndexManager:
         if hasattr(vector_store, '_faiss_index'):
             faiss_index = vector_store._faiss_index
             return {
-                "total_vectors": faiss_index.ntotal,
+                "total_vectors": faiss_index.ntotal - getattr(vector_store, 'num_deleted', 0),
                 "dimension": faiss_index.d,
                 "is_trained": faiss_index.is_trained,
                 "indexed_files": len(self.doc_manager.get_all_indexed_files())
@@ -209,6 +435,8 @@ class IndexManager:
         
         # 캐시 초기화
         self.embedding_cache.clear_cache()
+        self.query_cache.clear_cache()
+        prune_markdown_cache(max_age_days=None)
         
         # 인스턴스 변수 초기화
         self._index = None
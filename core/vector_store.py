@@ -0,0 +1,212 @@
+"""
+FAISS 벡터 저장소 확장
+노드 임베딩 배치 삽입과 파일 단위 선택 삭제 지원
+"""
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional, Set
+import logging
+
+import faiss
+import fsspec
+import numpy as np
+from llama_index.core.bridge.pydantic import PrivateAttr
+from llama_index.core.schema import BaseNode
+from llama_index.core.vector_stores.simple import DEFAULT_VECTOR_STORE, NAMESPACE_SEP
+from llama_index.core.vector_stores.types import DEFAULT_PERSIST_FNAME, VectorStoreQuery, VectorStoreQueryResult
+from llama_index.vector_stores.faiss import FaissVectorStore
+
+logger = logging.getLogger(__name__)
+
+# 파일 경로 -> 벡터 ID 매핑 사이드카 파일명 (faiss 인덱스와 같은 디렉토리에 저장)
+VECTOR_IDS_FILENAME = "vector_ids.json"
+
+# 삭제 표시(tombstone)된 벡터 ID 사이드카 파일명 (제거를 지원하지 않는 인덱스용)
+DELETED_IDS_FILENAME = "deleted_ids.json"
+
+# IndexIDMap2 파일 헤더 뒤 내부 인덱스 fourcc 위치 (fourcc 4 + d 4 + ntotal 8 + dummy 16 + is_trained 1 + metric 4)
+_INNER_FOURCC_OFFSET = 37
+
+def _read_only_io_flags(persist_path: str) -> int:
+    """읽기 전용 로드에 사용할 faiss IO 플래그 선택
+    
+    IVF 계열(fourcc "Iw..")은 IO_FLAG_MMAP으로 역색인 리스트를 메모리 맵하고,
+    Flat/HNSW는 IO_FLAG_MMAP으로는 벡터가 힙에 복사되므로 IO_FLAG_MMAP_IFC로
+    벡터 저장소 자체를 메모리 맵합니다. 두 플래그는 함께 쓸 수 없어 내부 인덱스
+    종류로 고르며, IO_FLAG_MMAP_IFC가 없는 구버전 faiss에서는 IO_FLAG_MMAP로 대체합니다.
+    """
+    with open(persist_path, 'rb') as f:
+        header = f.read(_INNER_FOURCC_OFFSET + 4)
+    if header[:4] == b"IxM2" and header[_INNER_FOURCC_OFFSET:_INNER_FOURCC_OFFSET + 2] == b"Iw":
+        return faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+    return getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+
+class BatchFaissVectorStore(FaissVectorStore):
+    """노드 배치를 단일 faiss 호출로 추가하고 파일 단위로 삭제하는 FAISS 벡터 저장소
+    
+    faiss 인덱스는 IndexIDMap2로 감싸져 있어야 하며, 벡터 ID는 노드 ID의
+    해시로 부여합니다. 파일 경로별 벡터 ID를 추적해 파일 삭제/수정 시
+    전체 재빌드 없이 해당 벡터만 제거할 수 있습니다.
+    
+    HNSW처럼 벡터 제거를 지원하지 않는 인덱스에서는 벡터 ID를 삭제 표시해 두고
+    검색 시 IDSelector로 제외합니다. 삭제 표시는 인덱스 재빌드 시 정리됩니다.
+    """
+    
+    _file_to_ids: Dict[str, List[int]] = PrivateAttr(default_factory=dict)
+    _deleted_ids: Set[int] = PrivateAttr(default_factory=set)
+    _search_params: Any = PrivateAttr(default=None)
+    
+    def __init__(
+        self,
+        faiss_index: Any,
+        file_to_ids: Optional[Dict[str, List[int]]] = None,
+        deleted_ids: Optional[Set[int]] = None,
+    ):
+        super().__init__(faiss_index=faiss_index)
+        self._file_to_ids = file_to_ids or {}
+        self._deleted_ids = set(deleted_ids or ())
+    
+    @property
+    def num_deleted(self) -> int:
+        """삭제 표시되어 검색에서 제외되는 벡터 수"""
+        return len(self._deleted_ids)
+    
+    @staticmethod
+    def _vector_id(node_id: str) -> int:
+        """노드 ID로부터 안정적인 63비트 양수 벡터 ID 생성"""
+        digest = hashlib.blake2b(node_id.encode('utf-8'), digest_size=8).digest()
+        return int.from_bytes(digest, 'little') & 0x7FFF_FFFF_FFFF_FFFF
+    
+    def add(self, nodes: List[BaseNode], **add_kwargs: Any) -> List[str]:
+        """노드 임베딩을 (N, d) float32 행렬로 묶어 한 번에 추가"""
+        if not nodes:
+            return []
+        
+        vectors = np.asarray([node.get_embedding() for node in nodes], dtype=np.float32)
+        ids = np.array([self._vector_id(node.node_id) for node in nodes], dtype=np.int64)
+        self._faiss_index.add_with_ids(vectors, ids)
+        
+        for node, vec_id in zip(nodes, ids.tolist()):
+            file_path = node.metadata.get('file_path')
+            if file_path:
+                self._file_to_ids.setdefault(file_path, []).append(vec_id)
+        
+        logger.debug(f"FAISS 벡터 추가: {len(nodes)}개")
+        return [str(vec_id) for vec_id in ids.tolist()]
+    
+    def delete_file(self, file_path: str) -> List[int]:
+        """파일에 속한 벡터 제거
+        
+        내부 인덱스가 제거를 지원하지 않으면 (예: HNSW) 삭제 표시 후 검색에서 제외합니다.
+        
+        Returns:
+            제거된 벡터 ID 리스트
+        """
+        ids = self._file_to_ids.get(file_path, [])
+        if ids:
+            try:
+                self._faiss_index.remove_ids(np.array(ids, dtype=np.int64))
+            except RuntimeError:
+                self._deleted_ids.update(ids)
+                self._search_params = None
+        self._file_to_ids.pop(file_path, None)
+        return ids
+    
+    def _make_search_params(self, selector) -> faiss.SearchParameters:
+        """내부 인덱스 종류에 맞는 검색 파라미터 생성
+        
+        params를 넘기면 인덱스에 설정된 efSearch/nprobe 대신 params 값이 쓰이므로
+        HNSW/IVF는 전용 클래스에 현재 설정값을 복사해 넘깁니다.
+        """
+        inner = faiss.downcast_index(self._faiss_index.index)
+        if isinstance(inner, faiss.IndexHNSW):
+            return faiss.SearchParametersHNSW(sel=selector, efSearch=inner.hnsw.efSearch)
+        ivf = faiss.try_extract_index_ivf(inner)
+        if ivf is not None:
+            return faiss.SearchParametersIVF(sel=selector, nprobe=ivf.nprobe)
+        return faiss.SearchParameters(sel=selector)
+    
+    def query(self, query: VectorStoreQuery, **kwargs: Any) -> VectorStoreQueryResult:
+        """유사도 검색 (삭제 표시된 벡터 제외)"""
+        if not self._deleted_ids:
+            return super().query(query, **kwargs)
+        
+        if query.filters is not None:
+            raise ValueError("Metadata filters not implemented for Faiss yet.")
+        
+        # 삭제 표시가 바뀔 때만 selector 재생성 (faiss 파이썬 래퍼가 하위 selector 참조를 유지)
+        if self._search_params is None:
+            deleted = np.fromiter(self._deleted_ids, dtype=np.int64, count=len(self._deleted_ids))
+            selector = faiss.IDSelectorNot(faiss.IDSelectorBatch(deleted))
+            self._search_params = self._make_search_params(selector)
+        
+        query_embedding = np.asarray(query.query_embedding, dtype=np.float32)[np.newaxis, :]
+        dists, indices = self._faiss_index.search(
+            query_embedding, query.similarity_top_k, params=self._search_params
+        )
+        
+        similarities, ids = [], []
+        for dist, idx in zip(dists[0].tolist(), indices[0].tolist()):
+            if idx >= 0:
+                similarities.append(dist)
+                ids.append(str(idx))
+        return VectorStoreQueryResult(similarities=similarities, ids=ids)
+    
+    @classmethod
+    def from_persist_dir(
+        cls,
+        persist_dir: str,
+        fs: Optional[fsspec.AbstractFileSystem] = None,
+        mmap: bool = False,
+    ) -> "BatchFaissVectorStore":
+        """저장 디렉토리에서 로드"""
+        persist_path = os.path.join(persist_dir, f"{DEFAULT_VECTOR_STORE}{NAMESPACE_SEP}{DEFAULT_PERSIST_FNAME}")
+        return cls.from_persist_path(persist_path, fs=fs, mmap=mmap)
+    
+    @classmethod
+    def from_persist_path(
+        cls,
+        persist_path: str,
+        fs: Optional[fsspec.AbstractFileSystem] = None,
+        mmap: bool = False,
+    ) -> "BatchFaissVectorStore":
+        """저장된 faiss 인덱스와 벡터 ID 매핑 로드
+        
+        Args:
+            mmap: True면 인덱스 파일을 읽기 전용 메모리 맵으로 로드 (Flat/HNSW 벡터와
+                IVF 역색인 리스트가 힙에 복사되지 않음). 벡터 추가/삭제가 필요한
+                경우에는 False로 로드해야 합니다.
+        """
+        if not os.path.exists(persist_path):
+            raise ValueError(f"저장된 FAISS 인덱스가 없습니다: {persist_path}")
+        
+        io_flags = _read_only_io_flags(persist_path) if mmap else 0
+        faiss_index = faiss.read_index(persist_path, io_flags)
+        
+        file_to_ids = {}
+        ids_path = os.path.join(os.path.dirname(persist_path), VECTOR_IDS_FILENAME)
+        if os.path.exists(ids_path):
+            with open(ids_path, 'r', encoding='utf-8') as f:
+                file_to_ids = json.load(f)
+        
+        deleted_ids = []
+        deleted_path = os.path.join(os.path.dirname(persist_path), DELETED_IDS_FILENAME)
+        if os.path.exists(deleted_path):
+            with open(deleted_path, 'r', encoding='utf-8') as f:
+                deleted_ids = json.load(f)
+        
+        return cls(faiss_index=faiss_index, file_to_ids=file_to_ids, deleted_ids=set(deleted_ids))
+    
+    def persist(self, persist_path: str, fs: Optional[fsspec.AbstractFileSystem] = None) -> None:
+        """faiss 인덱스, 벡터 ID 매핑, 삭제 표시 저장"""
+        super().persist(persist_path, fs=fs)
+        
+        ids_path = os.path.join(os.path.dirname(persist_path), VECTOR_IDS_FILENAME)
+        with open(ids_path, 'w', encoding='utf-8') as f:
+            json.dump(self._file_to_ids, f, ensure_ascii=False)
+        
+        # 재빌드된 인덱스에 이전 삭제 표시가 남지 않도록 비어 있어도 항상 기록
+        deleted_path = os.path.join(os.path.dirname(persist_path), DELETED_IDS_FILENAME)
+        with open(deleted_path, 'w', encoding='utf-8') as f:
+            json.dump(sorted(self._deleted_ids), f)
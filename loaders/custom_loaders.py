@@ -2,198 +2,541 @@
 커스텀 문서 로더
 다양한 파일 형식을 지원하는 최적화된 로더
 """
+import hashlib
+import io
 import json
+import mmap
+import os
+import re
+import shutil
+import tempfile
+import threading
+import zipfile
 import pandas as pd
 import markdown
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
 from pathlib import Path
-from typing import List
+from typing import Any, Iterator, List, Optional, Tuple, Union
 import logging
 
 import docx
 from llama_index.core import Document, SimpleDirectoryReader
 
+try:
+    import orjson  # 선택 의존성: 빠른 JSON 파싱/직렬화
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # 선택 의존성: 대용량 JSON 배열 스트리밍 파싱
+except ImportError:
+    ijson = None
+
+try:
+    import mistune  # 선택 의존성: 빠른 Markdown 렌더러
+except ImportError:
+    mistune = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv  # 선택 의존성: 필요한 CSV 컬럼만 C 레벨에서 파싱
+except ImportError:
+    pa = pa_csv = None
+
+try:
+    from lxml import etree  # DOCX 스트리밍 파싱 (python-docx 의존성)
+except ImportError:
+    etree = None
+
+from config.settings import LOAD_PROCESS_MIN_BYTES, LOAD_WORKERS, MARKDOWN_CACHE_DIR, MARKDOWN_CACHE_MAX_AGE_DAYS
+from utils.file_utils import cleanup_old_files
+
 logger = logging.getLogger(__name__)
 
+# 파싱이 GIL 바운드인 형식 (프로세스 풀에서 처리, PDF는 SimpleDirectoryReader가 일괄 병렬 처리)
+CPU_BOUND_EXTENSIONS = {'.docx'}
+
+# CSV를 나눠 읽을 행 수 (대용량 파일도 전체 DataFrame을 메모리에 올리지 않음)
+CSV_CHUNK_ROWS = 100_000
+
+def _csv_columns(file_path: Path) -> List[str]:
+    """CSV 헤더(컬럼 이름)만 읽기"""
+    if pa_csv is not None:
+        with pa_csv.open_csv(file_path) as reader:
+            return reader.schema.names
+    return pd.read_csv(file_path, nrows=0).columns.tolist()
+
+def _csv_to_tsv(file_path: Path, columns: List[str]) -> Tuple[str, int]:
+    """선택한 컬럼만 파싱해 탭 구분 텍스트로 변환 (텍스트, 행 수 반환)
+    
+    pyarrow가 있으면 나머지 컬럼은 토큰화하지 않고 건너뛰며, 값은 타입 추론 없이 원문 그대로 사용합니다.
+    어느 경로든 레코드 배치(청크) 단위로 처리해 전체 DataFrame을 만들지 않습니다.
+    """
+    buf = io.StringIO()
+    row_count = 0
+    if pa_csv is not None:
+        convert_options = pa_csv.ConvertOptions(
+            include_columns=columns,
+            column_types={col: pa.string() for col in columns},
+        )
+        with pa_csv.open_csv(file_path, convert_options=convert_options) as reader:
+            for i, batch in enumerate(reader):
+                batch.to_pandas().to_csv(buf, sep='\t', index=False, header=(i == 0))
+                row_count += batch.num_rows
+        return buf.getvalue(), row_count
+    
+    # pandas: 청크 단위 처리 (C 구현 CSV writer), pyarrow 경로와 같이 값은 문자열 원문 그대로 유지
+    chunks = pd.read_csv(
+        file_path, usecols=columns, dtype=str, keep_default_na=False, na_filter=False,
+        chunksize=CSV_CHUNK_ROWS,
+    )
+    for i, chunk in enumerate(chunks):
+        chunk[columns].to_csv(buf, sep='\t', index=False, header=(i == 0))
+        row_count += len(chunk)
+    return buf.getvalue(), row_count
+
+# orjson은 64비트 범위를 넘는 정수를 예외 없이 float로 바꾸므로 이 자릿수 이상의 숫자가 있으면 json으로 파싱
+_LONG_NUMBER = re.compile(rb'\d{19,}')
+
+def _loads(buf) -> Tuple[Any, bool]:
+    """JSON 파싱 (bytes/memoryview 입력, 파싱 결과와 orjson 사용 여부 반환)
+    
+    orjson이 없거나, 19자리 이상 숫자가 있거나, NaN 등 비표준 값으로 orjson 파싱에
+    실패하면 json을 사용합니다.
+    """
+    if orjson is not None and _LONG_NUMBER.search(buf) is None:
+        try:
+            return orjson.loads(buf), True
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(str(buf, 'utf-8')), False
+
+def _dumps(obj: Any, fast: bool = True) -> str:
+    """들여쓰기 2칸 JSON 직렬화
+    
+    orjson은 NaN/Infinity를 null로 바꾸므로 json으로 파싱한 데이터는 fast=False로
+    넘겨 json으로 직렬화합니다. orjson이 없거나 직렬화할 수 없는 값(64비트 초과 정수 등)이
+    있어도 json을 사용합니다.
+    """
+    if fast and orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+# 이 크기 이상의 최상위 JSON 배열은 요소 단위로 스트리밍 파싱 (ijson 필요)
+JSON_STREAM_MIN_BYTES = 64 << 20
+
+def _is_json_array(file_path: Path) -> bool:
+    """첫 번째 공백 아닌 바이트가 '['인지 확인"""
+    with open(file_path, 'rb') as f:
+        while True:
+            chunk = f.read(4096)
+            if not chunk:
+                return False
+            chunk = chunk.lstrip()
+            if chunk:
+                return chunk.startswith(b'[')
+
+def _stream_json_array(file_path: Path) -> Tuple[str, int]:
+    """최상위 JSON 배열을 요소 단위로 파싱해 텍스트로 변환 (텍스트, 요소 수 반환)
+    
+    전체 문서를 한 번에 객체로 만들지 않으며, 요소는 줄바꿈으로 구분합니다.
+    """
+    buf = io.StringIO()
+    count = 0
+    with open(file_path, 'rb') as f:
+        for item in ijson.items(f, 'item', use_float=True):
+            if count:
+                buf.write('\n')
+            buf.write(_dumps(item))
+            count += 1
+    return buf.getvalue(), count
+
+# Markdown -> HTML 렌더러 (mistune이 없으면 markdown 패키지 사용)
+if mistune is not None:
+    _md_to_html = mistune.create_markdown(escape=False, plugins=['table', 'strikethrough'])
+    MARKDOWN_RENDERER = f"mistune-{mistune.__version__}"
+else:
+    _md_local = threading.local()
+    
+    def _md_to_html(md_content: str) -> str:
+        """markdown 패키지로 변환 (스레드별 Markdown 인스턴스를 reset 후 재사용)"""
+        md = getattr(_md_local, 'md', None)
+        if md is None:
+            md = _md_local.md = markdown.Markdown()
+        return md.reset().convert(md_content)
+    
+    MARKDOWN_RENDERER = f"markdown-{markdown.__version__}"
+
+# 프로세스 내 변환 결과 LRU (다이제스트 키 -> HTML, 원문은 보관하지 않음)
+_MARKDOWN_MEMO_SIZE = 64
+_markdown_memo: "OrderedDict[str, str]" = OrderedDict()
+_markdown_memo_lock = threading.Lock()
+
+def _render_markdown(md_content: str) -> str:
+    """Markdown -> HTML 변환 (내용 해시 기반 디스크 캐시, 프로세스 내 LRU)"""
+    # 렌더러가 바뀌면 캐시 키도 바뀌도록 렌더러 태그 포함
+    key = hashlib.blake2b(
+        f"{MARKDOWN_RENDERER}\0{md_content}".encode('utf-8'), digest_size=16
+    ).hexdigest()
+    with _markdown_memo_lock:
+        html_content = _markdown_memo.get(key)
+        if html_content is not None:
+            _markdown_memo.move_to_end(key)
+            return html_content
+    
+    html_content = _render_markdown_disk(key, md_content)
+    
+    with _markdown_memo_lock:
+        _markdown_memo[key] = html_content
+        if len(_markdown_memo) > _MARKDOWN_MEMO_SIZE:
+            _markdown_memo.popitem(last=False)
+    return html_content
+
+def _render_markdown_disk(key: str, md_content: str) -> str:
+    """디스크 캐시에서 변환 결과를 읽고, 없으면 변환 후 저장"""
+    cache_file = MARKDOWN_CACHE_DIR / f"{key}.html"
+    try:
+        html_content = cache_file.read_text(encoding='utf-8')
+        os.utime(cache_file)  # 마지막 사용 시각 갱신 (오래된 항목 정리 기준)
+        return html_content
+    except FileNotFoundError:
+        pass
+    
+    html_content = _md_to_html(md_content)
+    
+    # 고유한 임시 파일에 쓴 뒤 교체해 동시 로드 중에도 불완전한 캐시 파일이 보이지 않도록 함
+    tmp_path = None
+    try:
+        MARKDOWN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=MARKDOWN_CACHE_DIR)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        os.replace(tmp_path, cache_file)
+    except OSError as e:
+        logger.debug(f"Markdown 캐시 저장 실패 {cache_file}: {e}")
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+    return html_content
+
+def prune_markdown_cache(max_age_days: Optional[float] = MARKDOWN_CACHE_MAX_AGE_DAYS) -> int:
+    """Markdown 변환 결과 캐시 정리
+    
+    Args:
+        max_age_days: 이 기간 동안 사용되지 않은 항목 삭제 (None이면 전체 삭제)
+        
+    Returns:
+        int: 삭제된 파일 수 (전체 삭제 시 0)
+    """
+    with _markdown_memo_lock:
+        _markdown_memo.clear()
+    if not MARKDOWN_CACHE_DIR.exists():
+        return 0
+    if max_age_days is None:
+        shutil.rmtree(MARKDOWN_CACHE_DIR, ignore_errors=True)
+        return 0
+    return cleanup_old_files(MARKDOWN_CACHE_DIR, max_age_days)
+
+# WordprocessingML 네임스페이스 태그
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_BODY, _W_P, _W_TBL = _W + 'body', _W + 'p', _W + 'tbl'
+_W_TEXT = {_W + 't': None, _W + 'tab': '\t', _W + 'br': '\n', _W + 'cr': '\n'}
+
+def _iter_docx_paragraphs(file_path: Path) -> Iterator[str]:
+    """word/document.xml을 iterparse로 스트리밍하며 본문 문단 텍스트 반환
+    
+    python-docx의 Document.paragraphs와 같이 본문 최상위 문단만 대상으로 하며,
+    처리한 요소는 즉시 해제해 문서 크기와 무관하게 메모리 사용량을 유지합니다.
+    """
+    with zipfile.ZipFile(file_path) as z, z.open('word/document.xml') as f:
+        for _, el in etree.iterparse(f, events=('end',), tag=(_W_P, _W_TBL)):
+            parent = el.getparent()
+            if parent is None or parent.tag != _W_BODY:
+                continue
+            if el.tag == _W_P:
+                yield ''.join(
+                    (node.text or '') if _W_TEXT[node.tag] is None else _W_TEXT[node.tag]
+                    for node in el.iter(*_W_TEXT)
+                )
+            # 처리한 문단/표와 앞선 형제 요소 해제
+            el.clear()
+            while el.getprevious() is not None:
+                del parent[0]
+
+@contextmanager
+def _mapped(file_path: Path) -> Iterator[Union[mmap.mmap, bytes]]:
+    """파일을 읽기 전용 메모리 맵으로 열기 (OS 페이지 캐시 직접 사용, 빈 파일은 b'')"""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+def _safe_load(label: str):
+    """로더 메소드 데코레이터 (예외 발생 시 로그를 남기고 빈 리스트 반환)"""
+    def decorator(load):
+        @wraps(load)
+        def wrapper(self, file_path: Path) -> List[Document]:
+            try:
+                return load(self, file_path)
+            except Exception as e:
+                logger.error(f"{label} 로드 실패 {file_path}: {e}")
+                return []
+        return wrapper
+    return decorator
+
 class CustomDocumentLoader:
     """다양한 문서 형식을 지원하는 커스텀 로더"""
     
     def __init__(self):
-        self.supported_extensions = {'.pdf', '.csv', '.md', '.docx', '.json'}
+        # 확장자(소문자) -> 로드 메소드
+        self._dispatch = {
+            '.pdf': self._load_pdf,
+            '.csv': self._load_csv,
+            '.md': self._load_markdown,
+            '.docx': self._load_docx,
+            '.json': self._load_json,
+        }
+        self.supported_extensions = set(self._dispatch)
     
     def load_documents(self, file_paths: List[Path]) -> List[Document]:
         """
-        다중 파일 로드
+        다중 파일 병렬 로드
+        
+        PDF는 SimpleDirectoryReader 한 번으로 일괄 로드하고, DOCX는 프로세스 풀,
+        나머지 I/O 위주 형식은 스레드 풀에서 처리합니다.
+        워커 수는 RAG_LOAD_WORKERS 환경 변수로 조정할 수 있습니다.
         
         Args:
             file_paths: 로드할 파일 경로 리스트
             
         Returns:
-            Document 객체 리스트
+            Document 객체 리스트 (완료 순서)
         """
-        documents = []
+        if len(file_paths) <= 1:
+            documents = [doc for file_path in file_paths for doc in self.load_one(file_path)]
+            logger.info(f"총 {len(documents)}개 문서 청크 로드 완료")
+            return documents
         
+        # 형식별로 분류하고 큰 파일부터 제출해 워커 간 작업량 균형 유지
+        sizes = {}
         for file_path in file_paths:
             try:
-                if file_path.suffix not in self.supported_extensions:
-                    logger.warning(f"지원하지 않는 파일 형식: {file_path}")
-                    continue
-                
-                # 파일별 로드 메소드 호출
-                if file_path.suffix == '.pdf':
-                    docs = self._load_pdf(file_path)
-                elif file_path.suffix == '.csv':
-                    docs = self._load_csv(file_path)
-                elif file_path.suffix == '.md':
-                    docs = self._load_markdown(file_path)
-                elif file_path.suffix == '.docx':
-                    docs = self._load_docx(file_path)
-                elif file_path.suffix == '.json':
-                    docs = self._load_json(file_path)
-                else:
-                    continue
-                
-                documents.extend(docs)
-                logger.debug(f"로드 완료: {file_path} ({len(docs)}개 청크)")
-                
-            except Exception as e:
-                logger.error(f"파일 로드 실패 {file_path}: {e}")
-                continue
+                sizes[file_path] = file_path.stat().st_size
+            except OSError:
+                sizes[file_path] = 0
+        pdf_paths = [p for p in file_paths if p.suffix.lower() == '.pdf']
+        cpu_bound = sorted(
+            (p for p in file_paths if p.suffix.lower() in CPU_BOUND_EXTENSIONS), key=sizes.get, reverse=True
+        )
+        io_bound = [
+            p for p in file_paths if p.suffix.lower() not in CPU_BOUND_EXTENSIONS and p.suffix.lower() != '.pdf'
+        ]
+        
+        # 작은 문서 묶음은 IPC 비용이 파싱 비용보다 크므로 스레드 풀(PDF는 단일 프로세스) 사용
+        use_processes = len(cpu_bound) > 1 and sum(sizes[p] for p in cpu_bound) >= LOAD_PROCESS_MIN_BYTES
+        cpu_executor = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        pdf_workers = None
+        if len(pdf_paths) > 1 and sum(sizes[p] for p in pdf_paths) >= LOAD_PROCESS_MIN_BYTES:
+            pdf_workers = min(LOAD_WORKERS, len(pdf_paths))
         
-        logger.info(f"총 {len(documents)}개 문서 청크 로드 완료")
+        documents = []
+        with cpu_executor(max_workers=LOAD_WORKERS) as cpu_pool, ThreadPoolExecutor(max_workers=LOAD_WORKERS) as io_pool:
+            futures = [cpu_pool.submit(self.load_one, p) for p in cpu_bound]
+            if pdf_paths:
+                futures.append(io_pool.submit(self._load_pdfs, pdf_paths, pdf_workers))
+            futures += [io_pool.submit(self.load_one, p) for p in io_bound]
+            for future in as_completed(futures):
+                documents.extend(future.result())
+        
+        logger.info(f"총 {len(documents)}개 문서 청크 로드 완료 ({cpu_executor.__name__} + ThreadPoolExecutor)")
         return documents
     
-    def _load_pdf(self, file_path: Path) -> List[Document]:
-        """PDF 파일 로드"""
-        try:
-            reader = SimpleDirectoryReader(input_files=[str(file_path)])
-            documents = reader.load_data()
-            
-            # 메타데이터 추가
-            for doc in documents:
-                doc.metadata.update({
-                    'source': file_path.name,
-                    'file_type': 'pdf',
-                    'file_path': str(file_path)
-                })
+    def load_one(self, file_path: Path) -> List[Document]:
+        """
+        단일 파일 로드 (병렬 로드 시 작업 단위)
+        
+        Args:
+            file_path: 로드할 파일 경로
             
-            return documents
-        except Exception as e:
-            logger.error(f"PDF 로드 실패 {file_path}: {e}")
+        Returns:
+            Document 객체 리스트 (실패 시 빈 리스트)
+        """
+        load = self._dispatch.get(file_path.suffix.lower())
+        if load is None:
+            logger.warning(f"지원하지 않는 파일 형식: {file_path}")
             return []
+        
+        # 예외 처리는 각 _load_* 메소드의 _safe_load에서 수행
+        docs = load(file_path)
+        
+        logger.debug(f"로드 완료: {file_path} ({len(docs)}개 청크)")
+        return docs
     
-    def _load_csv(self, file_path: Path) -> List[Document]:
-        """CSV 파일 로드 (특정 컬럼 선택 가능)"""
+    def _load_pdfs(self, file_paths: List[Path], num_workers: Optional[int] = None) -> List[Document]:
+        """PDF 파일 일괄 로드 (SimpleDirectoryReader 한 번 생성, num_workers개 프로세스로 파싱)"""
+        if len(file_paths) == 1:
+            return self.load_one(file_paths[0])
+        
         try:
-            df = pd.read_csv(file_path)
-            
-            # CSV가 비어있는지 확인
-            if df.empty:
-                logger.warning(f"빈 CSV 파일: {file_path}")
-                return []
-            
-            # 선택할 컬럼 결정 (Name, Purchase 우선, 없으면 모든 컬럼)
-            preferred_columns = ["Name", "Purchase"]
-            selected_columns = [col for col in preferred_columns if col in df.columns]
-            
-            if not selected_columns:
-                selected_columns = df.columns.tolist()
-                logger.info(f"기본 컬럼 사용: {selected_columns}")
-            
-            # 데이터를 텍스트로 변환
-            csv_text = df[selected_columns].to_string(index=False)
-            
-            document = Document(
-                text=csv_text,
-                metadata={
-                    'source': file_path.name,
-                    'file_type': 'csv',
-                    'file_path': str(file_path),
-                    'columns': selected_columns,
-                    'row_count': len(df)
-                }
-            )
-            
-            return [document]
-            
+            reader = SimpleDirectoryReader(input_files=[str(p) for p in file_paths])
+            documents = reader.load_data(num_workers=num_workers)
         except Exception as e:
-            logger.error(f"CSV 로드 실패 {file_path}: {e}")
+            logger.warning(f"PDF 일괄 로드 실패, 파일별로 로드: {e}")
+            return [doc for p in file_paths for doc in self.load_one(p)]
+        
+        # reader가 기록한 경로를 원래 경로와 매칭해 메타데이터 추가 (벡터 삭제 시 file_path 키 일치 필요)
+        by_path = {p.resolve(): p for p in file_paths}
+        for doc in documents:
+            doc_path = Path(doc.metadata.get('file_path', ''))
+            file_path = by_path.get(doc_path.resolve(), doc_path)
+            doc.metadata.update({
+                'source': file_path.name,
+                'file_type': 'pdf',
+                'file_path': str(file_path)
+            })
+        
+        logger.debug(f"PDF 일괄 로드 완료: {len(file_paths)}개 파일 ({len(documents)}개 페이지)")
+        return documents
+    
+    @_safe_load("PDF")
+    def _load_pdf(self, file_path: Path) -> List[Document]:
+        """PDF 파일 로드"""
+        reader = SimpleDirectoryReader(input_files=[str(file_path)])
+        documents = reader.load_data()
+        
+        # 메타데이터 추가
+        for doc in documents:
+            doc.metadata.update({
+                'source': file_path.name,
+                'file_type': 'pdf',
+                'file_path': str(file_path)
+            })
+        
+        return documents
+    
+    @_safe_load("CSV")
+    def _load_csv(self, file_path: Path) -> List[Document]:
+        """CSV 파일 로드 (특정 컬럼 선택 가능)"""
+        # 헤더만 먼저 읽어 필요한 컬럼만 파싱
+        columns = _csv_columns(file_path)
+        
+        # 선택할 컬럼 결정 (Name, Purchase 우선, 없으면 모든 컬럼)
+        preferred_columns = ["Name", "Purchase"]
+        selected_columns = [col for col in preferred_columns if col in columns]
+        
+        if not selected_columns:
+            selected_columns = columns
+            logger.info(f"기본 컬럼 사용: {selected_columns}")
+        
+        # 데이터를 탭 구분 텍스트로 변환
+        csv_text, row_count = _csv_to_tsv(file_path, selected_columns)
+        
+        # CSV가 비어있는지 확인
+        if row_count == 0:
+            logger.warning(f"빈 CSV 파일: {file_path}")
             return []
+        
+        document = Document(
+            text=csv_text,
+            metadata={
+                'source': file_path.name,
+                'file_type': 'csv',
+                'file_path': str(file_path),
+                'columns': selected_columns,
+                'row_count': row_count
+            }
+        )
+        
+        return [document]
     
+    @_safe_load("Markdown")
     def _load_markdown(self, file_path: Path) -> List[Document]:
         """Markdown 파일 로드"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                md_content = f.read()
-            
-            # Markdown을 HTML로 변환
-            html_content = markdown.markdown(md_content)
-            
-            document = Document(
-                text=html_content,
-                metadata={
-                    'source': file_path.name,
-                    'file_type': 'markdown',
-                    'file_path': str(file_path),
-                    'original_format': 'markdown'
-                }
-            )
-            
-            return [document]
-            
-        except Exception as e:
-            logger.error(f"Markdown 로드 실패 {file_path}: {e}")
-            return []
+        # 메모리 맵에서 바로 디코딩 (중간 bytes 복사 생략)
+        with _mapped(file_path) as mm:
+            md_content = str(mm, 'utf-8')
+        
+        # Markdown을 HTML로 변환 (변경되지 않은 문서는 캐시 사용)
+        html_content = _render_markdown(md_content)
+        
+        document = Document(
+            text=html_content,
+            metadata={
+                'source': file_path.name,
+                'file_type': 'markdown',
+                'file_path': str(file_path),
+                'original_format': 'markdown'
+            }
+        )
+        
+        return [document]
     
+    @_safe_load("DOCX")
     def _load_docx(self, file_path: Path) -> List[Document]:
         """DOCX 파일 로드"""
-        try:
+        # 모든 문단 텍스트 추출 (lxml 스트리밍, 불가능하면 python-docx)
+        paragraphs = None
+        if etree is not None:
+            try:
+                paragraphs = [text for text in _iter_docx_paragraphs(file_path) if text.strip()]
+            except (KeyError, etree.XMLSyntaxError) as e:
+                logger.debug(f"DOCX 스트리밍 파싱 실패, python-docx 사용 {file_path}: {e}")
+        
+        if paragraphs is None:
             doc = docx.Document(file_path)
-            
-            # 모든 문단 텍스트 추출
             paragraphs = [para.text for para in doc.paragraphs if para.text.strip()]
-            docx_text = "\n".join(paragraphs)
-            
-            if not docx_text.strip():
-                logger.warning(f"빈 DOCX 파일: {file_path}")
-                return []
-            
-            document = Document(
-                text=docx_text,
-                metadata={
-                    'source': file_path.name,
-                    'file_type': 'docx',
-                    'file_path': str(file_path),
-                    'paragraph_count': len(paragraphs)
-                }
-            )
-            
-            return [document]
-            
-        except Exception as e:
-            logger.error(f"DOCX 로드 실패 {file_path}: {e}")
+        docx_text = "\n".join(paragraphs)
+        
+        if not docx_text.strip():
+            logger.warning(f"빈 DOCX 파일: {file_path}")
             return []
+        
+        document = Document(
+            text=docx_text,
+            metadata={
+                'source': file_path.name,
+                'file_type': 'docx',
+                'file_path': str(file_path),
+                'paragraph_count': len(paragraphs)
+            }
+        )
+        
+        return [document]
     
+    @_safe_load("JSON")
     def _load_json(self, file_path: Path) -> List[Document]:
         """JSON 파일 로드"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                json_data = json.load(f)
-            
-            # JSON을 보기 좋은 텍스트로 변환
-            json_text = json.dumps(json_data, ensure_ascii=False, indent=2)
-            
-            document = Document(
-                text=json_text,
-                metadata={
-                    'source': file_path.name,
-                    'file_type': 'json',
-                    'file_path': str(file_path),
-                    'json_size': len(json_text)
-                }
-            )
-            
-            return [document]
+        if (ijson is not None
+                and file_path.stat().st_size >= JSON_STREAM_MIN_BYTES
+                and _is_json_array(file_path)):
+            # 대용량 배열은 요소 단위로 변환
+            json_text, item_count = _stream_json_array(file_path)
+            logger.info(f"JSON 배열 스트리밍 파싱: {file_path.name} ({item_count}개 요소)")
+        else:
+            with _mapped(file_path) as mm, memoryview(mm) as view:
+                json_data, parsed_fast = _loads(view)
             
-        except Exception as e:
-            logger.error(f"JSON 로드 실패 {file_path}: {e}")
-            return []
\ No newline at end of file
+            # JSON을 보기 좋은 텍스트로 변환 (json으로 파싱했으면 NaN 등을 보존하도록 json으로 직렬화)
+            json_text = _dumps(json_data, fast=parsed_fast)
+        
+        document = Document(
+            text=json_text,
+            metadata={
+                'source': file_path.name,
+                'file_type': 'json',
+                'file_path': str(file_path),
+                'json_size': len(json_text)
+            }
+        )
+        
+        return [document]
\ No newline at end of file
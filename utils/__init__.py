@@ -4,9 +4,13 @@
 RAG 시스템의 보조 기능들을 제공합니다:
 - 파일 처리 유틸리티
 - 성능 모니터링
+- 채팅 기록 관리
 - 로깅 설정
 - 공통 헬퍼 함수
 
+로깅 설정은 import 시 적용되지 않습니다. 애플리케이션에서 `utils.init()`을
+한 번 호출하거나 환경 변수 RAG_AUTO_LOG_SETUP=1 을 지정하세요.
+
 Example:
     from utils import performance_monitor, file_utils
     
@@ -20,19 +24,17 @@ Example:
 """
 
 # 주요 모듈들 import
-from .performance_monitor import PerformanceMonitor, performance_monitor
+import os
+from .performance_monitor import PerformanceMonitor, DEFAULT_PERFORMANCE_CONFIG, get_performance_monitor
+from .chat_history import ChatHistory
 from . import file_utils
 
+# 서브모듈 import로 바인딩된 모듈 객체 대신 __getattr__의 글로벌 인스턴스를 노출
+del performance_monitor
+
 # 패키지 레벨 상수
 SUPPORTED_LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
-DEFAULT_PERFORMANCE_CONFIG = {
-    "enable_monitoring": True,
-    "log_performance": True,
-    "track_memory": True,
-    "track_cpu": True
-}
-
 # 패키지 메타데이터
 __version__ = "1.0.0"
 __author__ = "RAG Chatbot Team" 
@@ -42,7 +44,10 @@ __description__ = "Utility functions and performance monitoring"
 __all__ = [
     "PerformanceMonitor",
     "performance_monitor",
+    "get_performance_monitor",
+    "ChatHistory",
     "file_utils",
+    "init",
     "setup_logging",
     "get_system_info",
     "format_bytes",
@@ -88,6 +93,8 @@ def get_system_info():
     }
 
 # 유틸리티 함수들
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 def format_bytes(bytes_value: int) -> str:
     """바이트를 읽기 쉬운 형식으로 변환
     
@@ -97,11 +104,12 @@ def format_bytes(bytes_value: int) -> str:
     Returns:
         str: 포맷된 문자열 (예: "1.5 GB")
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.1f} {unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.1f} PB"
+    if bytes_value < 1024:
+        return f"{bytes_value:.1f} B"
+    
+    # 단위 인덱스 = log1024(값), 비트 길이로 한 번에 계산
+    unit_index = min((int(bytes_value).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes_value / (1 << (unit_index * 10)):.1f} {_BYTE_UNITS[unit_index]}"
 
 def format_duration(seconds: float) -> str:
     """초를 읽기 쉬운 형식으로 변환
@@ -141,21 +149,30 @@ def ensure_directory(directory_path):
 import logging
 logger = logging.getLogger(__name__)
 
-# 기본 로깅 설정 적용
-setup_logging()
-
-logger.info("Utils package initialized")
-
-# 패키지 레벨 인스턴스 생성 (Singleton 패턴)
-# 애플리케이션 전체에서 하나의 성능 모니터 인스턴스 사용
-_global_performance_monitor = None
+_initialized = False
 
-def get_performance_monitor():
-    """글로벌 성능 모니터 인스턴스 반환"""
-    global _global_performance_monitor
-    if _global_performance_monitor is None:
-        _global_performance_monitor = PerformanceMonitor()
-    return _global_performance_monitor
-
-# 편의를 위해 글로벌 인스턴스를 performance_monitor로 alias
-performance_monitor = get_performance_monitor()
\ No newline at end of file
+def init(log_level: str = "INFO", log_format: str = None):
+    """패키지 초기화 (로깅 설정). 프로세스당 한 번만 적용되며 이후 호출은 무시
+    
+    Args:
+        log_level: 로그 레벨 (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        log_format: 커스텀 로그 포맷
+    """
+    global _initialized
+    if _initialized:
+        return
+    _initialized = True
+    
+    setup_logging(log_level, log_format)
+    logger.info("Utils package initialized")
+
+# 명시적으로 요청된 경우에만 import 시 로깅 설정 적용
+if os.getenv("RAG_AUTO_LOG_SETUP") == "1":
+    init()
+
+# 애플리케이션 전체에서 하나의 성능 모니터 인스턴스 사용 (Singleton 패턴, get_performance_monitor)
+def __getattr__(name: str):
+    # performance_monitor는 import 시점이 아니라 첫 접근 시 생성
+    if name == "performance_monitor":
+        return get_performance_monitor()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,29 @@
+"""
+채팅 기록 관리
+
+Streamlit 재실행마다 전체 기록을 다시 그리므로, 기록을 열 단위 리스트로
+저장하고 출처 중복 제거는 추가 시점에 한 번만 수행합니다.
+"""
+
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Tuple
+
+@dataclass
+class ChatHistory:
+    """채팅 기록 (역할/내용/출처를 각각의 리스트로 저장)"""
+    
+    roles: List[str] = field(default_factory=list)
+    contents: List[str] = field(default_factory=list)
+    sources: List[List[str]] = field(default_factory=list)
+    
+    def append(self, role: str, content: str, sources: Optional[List[str]] = None):
+        """메시지 추가 (sources는 중복 제거된 리스트로 전달)"""
+        self.roles.append(role)
+        self.contents.append(content)
+        self.sources.append(sources or [])
+    
+    def __iter__(self) -> Iterator[Tuple[str, str, List[str]]]:
+        return zip(self.roles, self.contents, self.sources)
+    
+    def __len__(self) -> int:
+        return len(self.roles)
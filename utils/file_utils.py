@@ -6,12 +6,33 @@
 
 import os
 import shutil
+import sys
+import tempfile
 from pathlib import Path
-from typing import List, Set, Optional, Tuple
+from typing import Iterator, List, Set, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+def _iter_files(directory: Path) -> Iterator[os.DirEntry]:
+    """디렉토리 하위 파일을 재귀적으로 순회 (os.scandir, 하위 디렉토리 링크는 따라가지 않음)
+    
+    읽을 수 없는 하위 디렉토리는 건너뜁니다.
+    """
+    stack = [os.fspath(directory)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError as e:
+            logger.debug(f"Cannot scan directory: {e}")
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
 def find_files_by_extension(directory: Path, extensions: Set[str]) -> List[Path]:
     """지정된 확장자의 파일들을 재귀적으로 찾기
     
@@ -32,9 +53,10 @@ def find_files_by_extension(directory: Path, extensions: Set[str]) -> List[Path]
     # 확장자를 소문자로 정규화
     extensions = {ext.lower() for ext in extensions}
     
-    for file_path in directory.rglob("*"):
-        if file_path.is_file() and file_path.suffix.lower() in extensions:
-            found_files.append(file_path)
+    # 확장자 확인 후 일치하는 파일만 Path 생성
+    for entry in _iter_files(directory):
+        if os.path.splitext(entry.name)[1].lower() in extensions:
+            found_files.append(Path(entry.path))
     
     logger.info(f"Found {len(found_files)} files with extensions {extensions} in {directory}")
     return found_files
@@ -65,9 +87,12 @@ def get_directory_size(directory: Path) -> int:
     """
     total_size = 0
     try:
-        for file_path in directory.rglob("*"):
-            if file_path.is_file():
-                total_size += get_file_size(file_path)
+        # DirEntry.stat() 결과를 사용해 파일당 stat 한 번
+        for entry in _iter_files(directory):
+            try:
+                total_size += entry.stat().st_size
+            except OSError:
+                logger.error(f"Cannot get size of file: {entry.path}")
     except Exception as e:
         logger.error(f"Error calculating directory size: {e}")
     
@@ -164,10 +189,13 @@ def safe_directory_delete(directory: Path, force: bool = False) -> bool:
             logger.error(f"Path is not a directory: {directory}")
             return False
         
-        # 디렉토리가 비어있지 않은 경우
-        if any(directory.iterdir()) and not force:
-            logger.warning(f"Directory is not empty and force=False: {directory}")
-            return False
+        # 디렉토리가 비어있지 않은 경우 (첫 항목 하나만 읽어 확인, force면 생략)
+        if not force:
+            with os.scandir(directory) as it:
+                empty = next(it, None) is None
+            if not empty:
+                logger.warning(f"Directory is not empty and force=False: {directory}")
+                return False
         
         # 디렉토리 삭제
         shutil.rmtree(directory)
@@ -195,17 +223,22 @@ def create_backup(file_path: Path, backup_suffix: str = ".backup") -> Optional[P
             logger.error(f"File does not exist: {file_path}")
             return None
         
-        # 백업 파일 경로 생성
+        # 백업 파일 경로를 O_EXCL로 선점 (기존 백업을 덮어쓰지 않음)
         backup_path = file_path.with_suffix(file_path.suffix + backup_suffix)
-        
-        # 백업 파일이 이미 존재하면 숫자 추가
-        counter = 1
-        while backup_path.exists():
-            backup_path = file_path.with_suffix(f"{file_path.suffix}{backup_suffix}.{counter}")
-            counter += 1
+        try:
+            fd = os.open(backup_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL)
+        except FileExistsError:
+            # 이미 존재하면 고유한 접미사를 붙여 생성 (기존 백업 수와 무관하게 한 번에 결정)
+            fd, backup_name = tempfile.mkstemp(prefix=f"{file_path.name}{backup_suffix}.", dir=file_path.parent)
+            backup_path = Path(backup_name)
+        os.close(fd)
         
         # 백업 생성
-        shutil.copy2(file_path, backup_path)
+        try:
+            shutil.copy2(file_path, backup_path)
+        except Exception:
+            backup_path.unlink(missing_ok=True)
+            raise
         logger.info(f"Backup created: {backup_path}")
         return backup_path
         
@@ -224,6 +257,7 @@ def cleanup_old_files(directory: Path, max_age_days: int, pattern: str = "*") ->
     Returns:
         int: 삭제된 파일 수
     """
+    import fnmatch
     import time
     
     try:
@@ -232,17 +266,24 @@ def cleanup_old_files(directory: Path, max_age_days: int, pattern: str = "*") ->
         max_age_seconds = max_age_days * 24 * 3600
         deleted_count = 0
         
-        for file_path in directory.glob(pattern):
-            if file_path.is_file():
-                file_age = current_time - file_path.stat().st_mtime
-                
-                if file_age > max_age_seconds:
-                    try:
-                        file_path.unlink()
-                        deleted_count += 1
-                        logger.debug(f"Deleted old file: {file_path}")
-                    except Exception as e:
-                        logger.error(f"Error deleting file {file_path}: {e}")
+        # 단일 디렉토리 패턴은 scandir + 이름 매칭 (DirEntry stat 재사용), 경로 패턴은 glob
+        if '/' in pattern or os.sep in pattern:
+            candidates = ((path, path.stat()) for path in directory.glob(pattern) if path.is_file())
+        else:
+            with os.scandir(directory) as it:
+                entries = [entry for entry in it if entry.is_file() and fnmatch.fnmatch(entry.name, pattern)]
+            candidates = ((Path(entry.path), entry.stat()) for entry in entries)
+        
+        for file_path, stat_result in candidates:
+            file_age = current_time - stat_result.st_mtime
+            
+            if file_age > max_age_seconds:
+                try:
+                    file_path.unlink()
+                    deleted_count += 1
+                    logger.debug(f"Deleted old file: {file_path}")
+                except Exception as e:
+                    logger.error(f"Error deleting file {file_path}: {e}")
         
         logger.info(f"Cleanup completed: {deleted_count} files deleted from {directory}")
         return deleted_count
@@ -276,14 +317,30 @@ def is_file_locked(file_path: Path) -> bool:
     Returns:
         bool: 파일이 잠겨있으면 True
     """
+    # 읽기 전용으로 열고 비차단 배타 잠금을 시도 (쓰기 권한 불필요, 파일 내용 변경 없음)
     try:
-        with open(file_path, 'r+'):
-            pass
-        return False
-    except IOError:
-        return True
-    except Exception:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
         return True
+    
+    try:
+        if sys.platform == "win32":
+            import msvcrt
+            try:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            except OSError:
+                return True
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                return True
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        return False
+    finally:
+        os.close(fd)
 
 def normalize_path(path: str) -> Path:
     """경로 정규화 (상대경로를 절대경로로, 경로 구분자 통일)
@@ -320,10 +377,9 @@ def count_files_by_extension(directory: Path) -> dict:
     extension_counts = {}
     
     try:
-        for file_path in directory.rglob("*"):
-            if file_path.is_file():
-                ext = get_file_extension_safely(file_path)
-                extension_counts[ext] = extension_counts.get(ext, 0) + 1
+        for entry in _iter_files(directory):
+            ext = os.path.splitext(entry.name)[1].lower()
+            extension_counts[ext] = extension_counts.get(ext, 0) + 1
     except Exception as e:
         logger.error(f"Error counting files: {e}")
     
@@ -6,7 +6,7 @@ import time
 import psutil
 import logging
 from functools import wraps
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
@@ -14,64 +14,70 @@ logger = logging.getLogger(__name__)
 class PerformanceMonitor:
     """성능 모니터링 클래스"""
     
-    def __init__(self):
+    def __init__(self, track_memory: bool = True):
         self.metrics = {}
         self.start_time = time.time()
+        self.track_memory = track_memory
+        self._proc = psutil.Process()
+        
+        # cpu_percent(interval=None)는 직전 호출 이후의 사용률을 반환하므로 기준점 설정
+        psutil.cpu_percent(interval=None)
     
     @contextmanager
     def measure_time(self, operation_name: str):
         """시간 측정 컨텍스트 매니저"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         try:
             yield
         finally:
-            elapsed_time = time.time() - start_time
+            elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
             self.metrics[operation_name] = elapsed_time
             logger.info(f"{operation_name}: {elapsed_time:.2f}초")
     
     def monitor_performance(self, func_name: str = None):
         """함수 성능 모니터링 데코레이터"""
         def decorator(func):
+            operation_name = func_name or f"{func.__module__}.{func.__name__}"
+            
             @wraps(func)
             def wrapper(*args, **kwargs):
-                operation_name = func_name or f"{func.__module__}.{func.__name__}"
-                
-                # 메모리 사용량 (시작)
-                process = psutil.Process()
-                memory_before = process.memory_info().rss / 1024 / 1024  # MB
+                # 메모리 사용량 (시작, track_memory=False면 생략)
+                memory_before = self._proc.memory_info().rss / 1024 / 1024 if self.track_memory else 0.0  # MB
                 
                 # 시간 측정
-                start_time = time.time()
+                start_ns = time.perf_counter_ns()
                 try:
                     result = func(*args, **kwargs)
                     return result
                 finally:
-                    elapsed_time = time.time() - start_time
-                    memory_after = process.memory_info().rss / 1024 / 1024  # MB
-                    memory_diff = memory_after - memory_before
+                    elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
+                    metrics = {'execution_time': elapsed_time}
+                    memory_log = ""
                     
-                    # 메트릭 저장
-                    self.metrics[operation_name] = {
-                        'execution_time': elapsed_time,
-                        'memory_before': memory_before,
-                        'memory_after': memory_after,
-                        'memory_diff': memory_diff
-                    }
+                    if self.track_memory:
+                        memory_after = self._proc.memory_info().rss / 1024 / 1024  # MB
+                        memory_diff = memory_after - memory_before
+                        metrics.update({
+                            'memory_before': memory_before,
+                            'memory_after': memory_after,
+                            'memory_diff': memory_diff
+                        })
+                        memory_log = f", 메모리 변화: {memory_diff:+.1f}MB"
                     
-                    logger.info(
-                        f"{operation_name} - 실행시간: {elapsed_time:.2f}초, "
-                        f"메모리 변화: {memory_diff:+.1f}MB"
-                    )
+                    # 메트릭 저장
+                    self.metrics[operation_name] = metrics
+                    logger.info(f"{operation_name} - 실행시간: {elapsed_time:.2f}초{memory_log}")
             return wrapper
         return decorator
     
     def get_system_info(self) -> Dict[str, Any]:
-        """시스템 정보 조회"""
+        """시스템 정보 조회 (CPU 사용률은 직전 조회 이후 구간 기준, 대기 없음)"""
+        memory = psutil.virtual_memory()
         return {
-            'cpu_percent': psutil.cpu_percent(interval=1),
-            'memory_percent': psutil.virtual_memory().percent,
+            'cpu_percent': psutil.cpu_percent(interval=None),
+            'memory_percent': memory.percent,
             'disk_usage': psutil.disk_usage('/').percent,
-            'available_memory_gb': psutil.virtual_memory().available / 1024 / 1024 / 1024
+            'available_memory_gb': memory.available / 1024 / 1024 / 1024
         }
     
     def get_performance_summary(self) -> Dict[str, Any]:
@@ -88,5 +94,31 @@ class PerformanceMonitor:
         self.metrics.clear()
         self.start_time = time.time()
 
-# 글로벌 모니터 인스턴스
-performance_monitor = PerformanceMonitor()
\ No newline at end of file
+# 글로벌 모니터 인스턴스 (import 시점이 아니라 첫 접근 시 생성)
+DEFAULT_PERFORMANCE_CONFIG = {
+    "enable_monitoring": True,
+    "log_performance": True,
+    "track_memory": True,
+    "track_cpu": True
+}
+
+_performance_monitor = None
+
+def get_performance_monitor(track_memory: Optional[bool] = None) -> PerformanceMonitor:
+    """글로벌 성능 모니터 인스턴스 반환 (첫 호출 시 생성)
+    
+    Args:
+        track_memory: 메모리 추적 여부 (None이면 DEFAULT_PERFORMANCE_CONFIG 값 사용)
+    """
+    global _performance_monitor
+    if _performance_monitor is None:
+        if track_memory is None:
+            track_memory = DEFAULT_PERFORMANCE_CONFIG["track_memory"]
+        _performance_monitor = PerformanceMonitor(track_memory=track_memory)
+    return _performance_monitor
+
+def __getattr__(name: str):
+    # `from utils.performance_monitor import performance_monitor` 호환
+    if name == "performance_monitor":
+        return get_performance_monitor()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")